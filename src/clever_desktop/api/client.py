@@ -64,12 +64,7 @@ class CleverCloudClient:
     # Authentication methods
     def has_stored_credentials(self) -> bool:
         """Check if stored credentials are available."""
-        try:
-            import keyring
-            stored_data = keyring.get_password(self.auth.KEYRING_SERVICE, self.auth.KEYRING_USERNAME)
-            return stored_data is not None
-        except Exception:
-            return False
+        return self.auth.has_stored_token()
     
     async def authenticate_with_stored_credentials(self) -> bool:
         """Authenticate using stored credentials."""
@@ -125,10 +120,8 @@ class CleverCloudClient:
                 self.logger.debug(f"Cache hit for {url}")
                 return cached_response
         
-        # Prepare headers
-        headers = {}
-        if self.auth.get_api_token():
-            headers.update(self.auth.get_auth_headers())
+        # Prepare headers (empty when no token is set)
+        headers = self.auth.get_auth_headers()
         
         # Retry logic
         for attempt in range(self.api_config.retry_count + 1):
@@ -215,9 +208,9 @@ class CleverCloudClient:
         """Get current user information."""
         return await self._make_request("GET", "/self")
     
-    async def get_organizations(self) -> List[Dict[str, Any]]:
+    async def get_organizations(self, use_cache: bool = True) -> List[Dict[str, Any]]:
         """Get user's organizations."""
-        response = await self._make_request("GET", "/organisations")
+        response = await self._make_request("GET", "/organisations", use_cache=use_cache)
         return response if isinstance(response, list) else []
     
     async def get_organization(self, org_id: str) -> Dict[str, Any]:
@@ -225,14 +218,14 @@ class CleverCloudClient:
         return await self._make_request("GET", f"/organisations/{org_id}")
     
     # Applications API  
-    async def get_applications(self, org_id: Optional[str] = None) -> List[Dict[str, Any]]:
+    async def get_applications(self, org_id: Optional[str] = None, use_cache: bool = True) -> List[Dict[str, Any]]:
         """Get applications for organization."""
         if org_id:
             endpoint = f"/organisations/{org_id}/applications"
         else:
             endpoint = "/self/applications"
         
-        response = await self._make_request("GET", endpoint)
+        response = await self._make_request("GET", endpoint, use_cache=use_cache)
         return response if isinstance(response, list) else []
     
     async def get_application(self, app_id: str) -> Dict[str, Any]:
@@ -281,13 +274,13 @@ class CleverCloudClient:
         response = await self._make_request("GET", f"/applications/{app_id}/instances")
         return response if isinstance(response, list) else []
     
-    async def get_application_env(self, app_id: str, org_id: Optional[str] = None) -> Dict[str, Any]:
+    async def get_application_env(self, app_id: str, org_id: Optional[str] = None, use_cache: bool = True) -> Dict[str, Any]:
         """Get application environment variables."""
         if org_id:
             endpoint = f"/organisations/{org_id}/applications/{app_id}/env"
         else:
             endpoint = f"/applications/{app_id}/env"
-        return await self._make_request("GET", endpoint)
+        return await self._make_request("GET", endpoint, use_cache=use_cache)
     
     async def set_application_env(self, app_id: str, env_vars: Dict[str, str]) -> Dict[str, Any]:
         """Set application environment variables."""
@@ -373,14 +366,15 @@ class CleverCloudClient:
         self,
         app_id: str,
         limit: int = 100,
-        since: Optional[str] = None
+        since: Optional[str] = None,
+        use_cache: bool = True
     ) -> List[Dict[str, Any]]:
         """Get application logs."""
         params = {"limit": limit}
         if since:
             params["since"] = since
         
-        response = await self._make_request("GET", f"/applications/{app_id}/logs", params=params)
+        response = await self._make_request("GET", f"/applications/{app_id}/logs", params=params, use_cache=use_cache)
         return response if isinstance(response, list) else []
     
     # Deployment API
@@ -0,0 +1,84 @@
+"""
+Background I/O Loop
+
+A single long-lived asyncio loop on one worker thread, shared by every widget
+that talks to the API, with an API client bound to it so connections stay
+warm between calls.
+"""
+
+import asyncio
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Awaitable, Optional
+
+from PySide6.QtCore import QCoreApplication
+
+from .client import CleverCloudClient
+
+
+class IOLoop:
+    """Asyncio loop running on a worker thread, started on first use and stopped when the application quits."""
+    
+    # Seconds running tasks get, all together, to finish when the application quits
+    SHUTDOWN_TIMEOUT = 3
+    
+    def __init__(self):
+        self.logger = logging.getLogger(__name__)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._client: Optional[CleverCloudClient] = None  # only touched from the loop
+    
+    def submit(self, coro: Awaitable) -> Future:
+        """Schedule a coroutine on the loop and return a future usable from any thread."""
+        if self._loop is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='clever-io')
+            self._loop = asyncio.new_event_loop()
+            self._executor.submit(self._loop.run_forever)
+            
+            app = QCoreApplication.instance()
+            if app is not None:
+                app.aboutToQuit.connect(self.shutdown)
+        
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+    
+    async def get_client(self, api_client: CleverCloudClient) -> CleverCloudClient:
+        """Get the API client bound to the loop, synced with the auth token of api_client (runs on the loop)."""
+        if self._client is None:
+            self._client = CleverCloudClient()
+        token = api_client.auth.get_api_token()
+        if token:
+            self._client.auth.api_token = token
+        return self._client
+    
+    def shutdown(self):
+        """Let running tasks finish within SHUTDOWN_TIMEOUT, then stop the loop and close its API client."""
+        if self._loop is None or self._loop.is_closed():
+            return
+        
+        future = asyncio.run_coroutine_threadsafe(self._drain(), self._loop)
+        try:
+            future.result(timeout=self.SHUTDOWN_TIMEOUT + 2)
+        except Exception as e:
+            self.logger.warning(f"Failed to drain the I/O loop: {e}")
+        
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._executor.shutdown(wait=True)
+        self._loop.close()
+    
+    async def _drain(self):
+        """Let the other tasks finish within one shared deadline, then close the client (runs on the loop)."""
+        current = asyncio.current_task()
+        tasks = [task for task in asyncio.all_tasks() if task is not current]
+        if tasks:
+            _, pending = await asyncio.wait(tasks, timeout=self.SHUTDOWN_TIMEOUT)
+            if pending:
+                self.logger.warning("Abandoning %d I/O tasks still running at shutdown", len(pending))
+        
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+
+
+# Shared by all widgets: one worker thread and one loop-bound API client per process
+io_loop = IOLoop()
+
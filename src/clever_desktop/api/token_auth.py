@@ -38,12 +38,23 @@ class CleverCloudTokenAuth(QObject):
         super().__init__()
         self.api_token = None
         self.user_info = None
+        self._has_stored_token: Optional[bool] = None  # keyring probe, kept in sync on store/clear
         logger.info("API Token authentication manager initialized")
     
     def get_api_token(self) -> Optional[str]:
         """Get current API token."""
         return self.api_token
     
+    def has_stored_token(self) -> bool:
+        """Check if an API token is stored, reading the keyring only the first time."""
+        if self._has_stored_token is None:
+            try:
+                stored_token = keyring.get_password(self.KEYRING_SERVICE, self.KEYRING_USERNAME)
+            except Exception:
+                return False
+            self._has_stored_token = stored_token is not None
+        return self._has_stored_token
+    
     def get_auth_headers(self, method: str = None, url: str = None, params: dict = None) -> Dict[str, str]:
         """Get authentication headers for API requests."""
         if not self.api_token:
@@ -74,6 +85,7 @@ class CleverCloudTokenAuth(QObject):
         """Load stored API token."""
         try:
             stored_token = keyring.get_password(self.KEYRING_SERVICE, self.KEYRING_USERNAME)
+            self._has_stored_token = stored_token is not None
             if stored_token:
                 self.api_token = stored_token
                 
@@ -123,6 +135,7 @@ class CleverCloudTokenAuth(QObject):
         """Store API token securely."""
         try:
             keyring.set_password(self.KEYRING_SERVICE, self.KEYRING_USERNAME, token)
+            self._has_stored_token = True
             self.api_token = token
             logger.info("API token stored successfully")
             
@@ -157,8 +170,10 @@ class CleverCloudTokenAuth(QObject):
         """Clear stored authentication data."""
         try:
             keyring.delete_password(self.KEYRING_SERVICE, self.KEYRING_USERNAME)
+            self._has_stored_token = False
             logger.info("Stored authentication cleared")
         except Exception as e:
+            self._has_stored_token = None  # probe the keyring again next time
             logger.error(f"Failed to clear stored auth: {e}")
         
         self.api_token = None
@@ -6,9 +6,12 @@ Handles application resources like icons, images, and other assets.
 
 import os
 from pathlib import Path
-from PySide6.QtGui import QIcon, QPixmap
+from PySide6.QtGui import QIcon, QPixmap, QPainter, QFont
 from PySide6.QtSvg import QSvgRenderer
-from PySide6.QtCore import QSize
+from PySide6.QtCore import QSize, Qt
+
+# Icons rendered from emoji, keyed by (emoji, size)
+_emoji_icons = {}
 
 
 def get_resource_path(filename: str) -> Path:
@@ -34,7 +37,6 @@ def load_icon(filename: str, size: QSize = None) -> QIcon:
         pixmap = QPixmap(size)
         pixmap.fill()  # Fill with transparent
         
-        from PySide6.QtGui import QPainter
         painter = QPainter(pixmap)
         renderer.render(painter)
         painter.end()
@@ -53,4 +55,23 @@ def get_app_icon() -> QIcon:
 
 def get_tray_icon() -> QIcon:
     """Get the system tray icon."""
-    return load_icon("icon.svg", QSize(22, 22)) 
\ No newline at end of file
+    return load_icon("icon.svg", QSize(22, 22)) 
+
+
+def emoji_icon(emoji: str, size: int = 16) -> QIcon:
+    """Get an icon rendered from an emoji, rendering it only once per size."""
+    key = (emoji, size)
+    icon = _emoji_icons.get(key)
+    if icon is None:
+        pixmap = QPixmap(size, size)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        
+        font = QFont()
+        font.setPixelSize(size - 2)
+        painter = QPainter(pixmap)
+        painter.setFont(font)
+        painter.drawText(pixmap.rect(), Qt.AlignmentFlag.AlignCenter, emoji)
+        painter.end()
+        
+        icon = _emoji_icons[key] = QIcon(pixmap)
+    return icon
@@ -5,6 +5,7 @@ Comprehensive add-ons management interface with listing, creation, and configura
 """
 
 import logging
+import time
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 
@@ -432,6 +433,9 @@ class AddonCreationDialog(QDialog):
 class AddonsPage(QWidget):
     """Main add-ons management page."""
     
+    # Seconds during which loaded data is considered fresh on showEvent
+    SHOW_REFRESH_TTL = 30
+    
     def __init__(self, api_client: CleverCloudClient, parent=None):
         super().__init__(parent)
         self.api_client = api_client
@@ -441,6 +445,8 @@ class AddonsPage(QWidget):
         self.current_org_id = None  # Will be set when organization is selected
         self.addons = []
         self.filtered_addons = []
+        self._last_load = 0.0  # time.monotonic() of the last successful load
+        self._addons_loads: Dict[QThread, QObject] = {}  # running thread -> loader, kept until finished
         
         self.setup_ui()
         self.setup_refresh_timer()
@@ -637,8 +643,8 @@ class AddonsPage(QWidget):
         """Refresh add-ons asynchronously."""
         
         class AddonsLoader(QObject):
-            data_loaded = Signal(list)  # addons
-            error_occurred = Signal(str)
+            data_loaded = Signal(str, list)  # org_id, addons
+            error_occurred = Signal(str, str)  # org_id, error
             
             def __init__(self, api_client, org_id, logger):
                 super().__init__()
@@ -676,77 +682,72 @@ class AddonsPage(QWidget):
                     try:
                         # Run async code in this thread
                         addons = loop.run_until_complete(fetch_addons())
-                        self.data_loaded.emit(addons)
+                        self.data_loaded.emit(self.org_id, addons)
                     finally:
                         loop.close()
                 except Exception as e:
-                    self.error_occurred.emit(str(e))
-        
-        # Create thread and loader
-        if hasattr(self, 'addons_thread') and self.addons_thread.isRunning():
-            self.logger.info("Stopping existing add-ons thread")
-            self.addons_thread.quit()
-            self.addons_thread.wait(2000)  # Wait up to 2 seconds
-            if self.addons_thread.isRunning():
-                self.logger.warning("Force terminating add-ons thread")
-                self.addons_thread.terminate()
-                self.addons_thread.wait(1000)
-        
-        self.addons_thread = QThread()
-        self.addons_loader = AddonsLoader(self.api_client, self.current_org_id, self.logger)
-        self.addons_loader.moveToThread(self.addons_thread)
+                    self.error_occurred.emit(self.org_id, str(e))
+        
+        # Create thread and loader; earlier loads finish on their own and are ignored
+        # if the organization changed in the meantime
+        thread = QThread(self)
+        loader = AddonsLoader(self.api_client, self.current_org_id, self.logger)
+        loader.moveToThread(thread)
+        self._addons_loads[thread] = loader
         
         # Connect signals
-        self.addons_loader.data_loaded.connect(self._on_addons_loaded)
-        self.addons_loader.error_occurred.connect(self._on_addons_error)
-        self.addons_thread.started.connect(self.addons_loader.load_data)
+        loader.data_loaded.connect(self._on_addons_loaded)
+        loader.error_occurred.connect(self._on_addons_error)
+        loader.data_loaded.connect(thread.quit)
+        loader.error_occurred.connect(thread.quit)
+        thread.started.connect(loader.load_data)
+        
+        # Let Qt release both objects once the thread has stopped, without blocking the GUI
+        thread.finished.connect(loader.deleteLater)
+        thread.finished.connect(self._on_addons_thread_finished)
         
         # Start thread
-        self.addons_thread.start()
+        thread.start()
         self.logger.info("Started add-ons loading thread")
     
-    def _on_addons_loaded(self, addons: list):
+    def _on_addons_thread_finished(self):
+        """Release a finished add-ons loading thread and its loader."""
+        thread = self.sender()
+        self._addons_loads.pop(thread, None)
+        thread.deleteLater()
+    
+    def _on_addons_loaded(self, org_id: str, addons: list):
         """Handle successful add-ons loading."""
+        if org_id != self.current_org_id:
+            self.logger.info(f"Ignoring add-ons loaded for previous organization {org_id}")
+            return
+        
         self.logger.info(f"Add-ons loading completed: {len(addons)} add-ons")
         
         # Store add-ons
         self.addons = addons
+        self._last_load = time.monotonic()
         
         # Update provider filter and display
         self.update_provider_filter()
         self.filter_addons()
-        
-        # Cleanup thread
-        self.addons_thread.quit()
-        self.addons_thread.wait()
     
-    def _on_addons_error(self, error: str):
+    def _on_addons_error(self, org_id: str, error: str):
         """Handle add-ons loading error."""
+        if org_id != self.current_org_id:
+            return
+        
         self.logger.error(f"Add-ons loading failed: {error}")
         
         # Show empty state with error
         self.addons = []
         self.update_addons_display()
-        
-        # Cleanup thread
-        self.addons_thread.quit()
-        self.addons_thread.wait()
     
     def set_organization(self, org_id: str):
         """Set the current organization and refresh add-ons."""
         self.current_org_id = org_id
         self.logger.info(f"Add-ons page: Organization changed to {org_id}")
         
-        # Cancel any running threads first
-        if hasattr(self, 'addons_thread') and self.addons_thread.isRunning():
-            self.logger.info("Cancelling existing add-ons loading thread")
-            self.addons_thread.quit()
-            self.addons_thread.wait(3000)  # Wait up to 3 seconds
-            if self.addons_thread.isRunning():
-                self.logger.warning("Add-ons thread did not stop gracefully, terminating")
-                self.addons_thread.terminate()
-                self.addons_thread.wait(1000)
-        
         # Refresh add-ons with new organization
         self.refresh_addons()
     
@@ -889,6 +890,6 @@ class AddonsPage(QWidget):
     def showEvent(self, event):
         """Handle page show event."""
         super().showEvent(event)
-        # Refresh add-ons when page is shown
-        if hasattr(self, 'api_client'):
+        # Refresh add-ons when page is shown, unless the data is still fresh
+        if self.api_client is not None and time.monotonic() - self._last_load > self.SHOW_REFRESH_TTL:
             self.refresh_addons() 
\ No newline at end of file
@@ -4,198 +4,514 @@ Applications Management Page
 Page for managing Clever Cloud applications with list view, details, and actions.
 """
 
+import asyncio
+import json
 import logging
-from typing import Dict, Any, List, Optional
+import re
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache, partial
+from html import escape
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional, Set, Tuple
 
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, QLabel, QPushButton,
-    QFrame, QScrollArea, QTableWidget, QTableWidgetItem, QHeaderView,
-    QComboBox, QLineEdit, QGroupBox, QProgressBar, QMenu, QMessageBox,
-    QSplitter, QTextEdit, QTabWidget, QDialog, QFormLayout, QCheckBox,
-    QFileDialog, QApplication
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
+    QFrame, QListView, QTableView, QHeaderView, QStyledItemDelegate,
+    QStyleOptionButton, QStyle, QComboBox, QLineEdit, QGroupBox, QProgressBar,
+    QMenu, QMessageBox, QSplitter, QPlainTextEdit, QTabWidget, QDialog, QFormLayout,
+    QFileDialog, QApplication, QInputDialog, QProgressDialog, QGraphicsOpacityEffect
 )
-from PySide6.QtCore import Qt, Signal, QTimer, QThread, QObject
-from PySide6.QtGui import QFont, QPalette, QAction, QPixmap
+from PySide6.QtCore import (
+    Qt, Signal, QTimer, QObject, QSignalBlocker, QPropertyAnimation, QPoint, QRect, QSize,
+    QEvent, QAbstractListModel, QAbstractTableModel, QModelIndex, QSortFilterProxyModel,
+    QRunnable, QThreadPool
+)
+from PySide6.QtGui import QFont, QFontMetrics, QPalette, QAction, QPixmap, QPainter, QColor
 
 from ..api.client import CleverCloudClient
+from ..api.io_loop import io_loop
+from ..resources import emoji_icon
+
+try:
+    import orjson  # optional, speeds up environment import/export
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+
+# Colors of the application state badges
+STATUS_COLORS = {
+    'RUNNING': '#28a745',
+    'STOPPED': '#dc3545',
+    'DEPLOYING': '#007ACC',
+    'RESTARTING': '#ffc107',
+    'UNKNOWN': '#6c757d'
+}
+
+# Buttons of the confirmation dialogs
+YES_NO_BUTTONS = QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
 
+# Variable names containing one of these keywords have their value masked.
+# 'key' and 'pass' also cover 'api_key', 'password' and the like.
+SENSITIVE_NAME_RE = re.compile(
+    r'secret|key|token|auth|credential|private|pass|pwd',
+    re.IGNORECASE
+)
+
+# One NAME=value assignment per line of a .env file; blank and comment lines don't match
+ENV_LINE_RE = re.compile(r'^[ \t]*([^=\s#][^=\n]*?)[ \t]*=[ \t]*(.*?)[ \t\r]*$', re.MULTILINE)
+
+
+@dataclass
+class CardState:
+    """Display fields of an application card, extracted once from the API data."""
+    
+    # Declared explicitly since dataclass(slots=True) needs Python 3.10
+    __slots__ = ('id', 'name', 'state', 'instance_type', 'zone', 'search_key')
+    
+    id: str
+    name: str
+    state: str
+    instance_type: str
+    zone: str
+    search_key: str  # casefolded name, matched by the search box
+    
+    @classmethod
+    def from_app_data(cls, app_data: Dict[str, Any]) -> 'CardState':
+        """Build the card state from raw application data."""
+        name = app_data.get('name', 'Unknown App')
+        return cls(
+            id=app_data.get('id', ''),
+            name=name,
+            state=app_data.get('state', 'UNKNOWN'),
+            instance_type=app_data.get('instance', {}).get('type', 'Unknown'),
+            zone=app_data.get('zone', 'Unknown'),
+            search_key=name.casefold(),
+        )
 
-class ApplicationCard(QFrame):
-    """Application card widget for grid view."""
+
+@dataclass
+class ActionResult:
+    """Outcome of an application action, reported to the GUI thread."""
     
-    # Signals
-    application_selected = Signal(dict)  # application_data
-    action_requested = Signal(str, dict)  # action, application_data
+    __slots__ = ('action', 'app_id', 'app_name', 'success', 'message')
     
-    def __init__(self, app_data: Dict[str, Any], parent=None):
-        super().__init__(parent)
-        self.app_data = app_data
-        self.setup_ui()
-        self.setup_styles()
+    action: str
+    app_id: str
+    app_name: str
+    success: bool
+    message: str
+
+
+class ApplicationListModel(QAbstractListModel):
+    """List model of applications, one card per row."""
     
-    def setup_ui(self):
-        """Setup the card UI."""
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(15, 15, 15, 15)
-        layout.setSpacing(10)
-        
-        # Header with name and status
-        header_layout = QHBoxLayout()
-        
-        # App name
-        name = self.app_data.get('name', 'Unknown App')
-        self.name_label = QLabel(name)
-        self.name_label.setObjectName("appName")
-        header_layout.addWidget(self.name_label)
-        
-        header_layout.addStretch()
-        
-        # Status indicator
-        state = self.app_data.get('state', 'UNKNOWN')
-        status_color = self.get_status_color(state)
-        self.status_label = QLabel(state)
-        self.status_label.setObjectName("appStatus")
-        self.status_label.setStyleSheet(f"""
-            background-color: {status_color};
-            color: white;
-            padding: 4px 8px;
-            border-radius: 12px;
-            font-size: 12px;
-            font-weight: bold;
-        """)
-        header_layout.addWidget(self.status_label)
-        
-        layout.addLayout(header_layout)
-        
-        # App type and zone
-        app_type = self.app_data.get('instance', {}).get('type', 'Unknown')
-        zone = self.app_data.get('zone', 'Unknown')
-        
-        info_label = QLabel(f"📦 {app_type} • 🌍 {zone}")
-        info_label.setObjectName("appInfo")
-        layout.addWidget(info_label)
-        
-        # Description or ID
-        app_id = self.app_data.get('id', '')
-        desc_label = QLabel(f"ID: {app_id[:12]}...")
-        desc_label.setObjectName("appDescription")
-        layout.addWidget(desc_label)
-        
-        # Action buttons
-        buttons_layout = QHBoxLayout()
-        
-        # View details button
-        self.details_btn = QPushButton("Details")
-        self.details_btn.setObjectName("detailsButton")
-        self.details_btn.clicked.connect(lambda: self.application_selected.emit(self.app_data))
-        buttons_layout.addWidget(self.details_btn)
-        
-        # Quick actions menu
-        self.actions_btn = QPushButton("Actions ▼")
-        self.actions_btn.setObjectName("actionsButton")
-        self.setup_actions_menu()
-        buttons_layout.addWidget(self.actions_btn)
-        
-        layout.addLayout(buttons_layout)
-    
-    def get_status_color(self, state: str) -> str:
-        """Get color for application state."""
-        colors = {
-            'RUNNING': '#28a745',
-            'STOPPED': '#dc3545',
-            'DEPLOYING': '#007ACC',
-            'RESTARTING': '#ffc107',
-            'UNKNOWN': '#6c757d'
-        }
-        return colors.get(state, '#6c757d')
+    AppDataRole = Qt.ItemDataRole.UserRole       # raw application data (dict)
+    CardStateRole = Qt.ItemDataRole.UserRole + 1  # CardState
+    SearchRole = Qt.ItemDataRole.UserRole + 2     # casefolded name, used for filtering
     
-    def setup_actions_menu(self):
-        """Setup the actions menu."""
-        menu = QMenu(self)
-        
-        # Common actions based on state
-        state = self.app_data.get('state', 'UNKNOWN')
-        
-        if state == 'RUNNING':
-            restart_action = QAction("🔄 Restart", self)
-            restart_action.triggered.connect(lambda: self.action_requested.emit('restart', self.app_data))
-            menu.addAction(restart_action)
-            
-            stop_action = QAction("⏹️ Stop", self)
-            stop_action.triggered.connect(lambda: self.action_requested.emit('stop', self.app_data))
-            menu.addAction(stop_action)
-        
-        elif state == 'STOPPED':
-            start_action = QAction("▶️ Start", self)
-            start_action.triggered.connect(lambda: self.action_requested.emit('start', self.app_data))
-            menu.addAction(start_action)
-        
-        menu.addSeparator()
-        
-        # Always available actions
-        logs_action = QAction("📋 View Logs", self)
-        logs_action.triggered.connect(lambda: self.action_requested.emit('logs', self.app_data))
-        menu.addAction(logs_action)
-        
-        env_action = QAction("⚙️ Environment", self)
-        env_action.triggered.connect(lambda: self.action_requested.emit('environment', self.app_data))
-        menu.addAction(env_action)
-        
-        deploy_action = QAction("🚀 Deploy", self)
-        deploy_action.triggered.connect(lambda: self.action_requested.emit('deploy', self.app_data))
-        menu.addAction(deploy_action)
-        
-        menu.addSeparator()
-        
-        delete_action = QAction("🗑️ Delete", self)
-        delete_action.triggered.connect(lambda: self.action_requested.emit('delete', self.app_data))
-        menu.addAction(delete_action)
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._apps: List[Dict[str, Any]] = []
+        self._states: List[CardState] = []
+        self._rows: Dict[str, int] = {}  # app_id -> row
+    
+    def set_applications(self, applications: List[Dict[str, Any]]):
+        """Replace the applications, only signalling changed rows when the ids are unchanged."""
+        states = [CardState.from_app_data(app) for app in applications]
+        if [state.id for state in states] != [state.id for state in self._states]:
+            self.beginResetModel()
+            self._apps = list(applications)
+            self._states = states
+            self._rows = {state.id: row for row, state in enumerate(states)}
+            self.endResetModel()
+            return
         
-        self.actions_btn.setMenu(menu)
+        changed = [row for row, (old, new) in enumerate(zip(self._states, states)) if old != new]
+        self._apps = list(applications)
+        self._states = states
+        for row in changed:
+            index = self.index(row)
+            self.dataChanged.emit(index, index)
+    
+    def update_application(self, update: Dict[str, Any]) -> Optional[tuple]:
+        """Merge partial data into one application's row; return (row, merged data) or None."""
+        row = self._rows.get(update.get('id'))
+        if row is None:
+            return None
+        
+        app_data = {**self._apps[row], **update}
+        self._apps[row] = app_data
+        self._states[row] = CardState.from_app_data(app_data)
+        index = self.index(row)
+        self.dataChanged.emit(index, index)
+        return row, app_data
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._apps)
+    
+    def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        row = index.row()
+        if role == self.CardStateRole:
+            return self._states[row]
+        if role == self.AppDataRole:
+            return self._apps[row]
+        if role == self.SearchRole:
+            return self._states[row].search_key
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._states[row].name
+        return None
+
+
+class ApplicationCardDelegate(QStyledItemDelegate):
+    """Paints an application card per row, with its Details and Actions buttons."""
     
-    def setup_styles(self):
-        """Setup card styles."""
-        self.setStyleSheet("""
-        ApplicationCard {
-            background-color: white;
-            border: 1px solid #e9ecef;
-            border-radius: 8px;
-        }
-        
-        ApplicationCard:hover {
-            border-color: #007ACC;
-        }
-        
-        #appName {
-            font-size: 16px;
-            font-weight: bold;
-            color: #212529;
-        }
-        
-        #appInfo {
-            color: #6c757d;
-            font-size: 14px;
-        }
-        
-        #appDescription {
-            color: #6c757d;
-            font-size: 12px;
-        }
-        
-        #detailsButton, #actionsButton {
-            padding: 6px 12px;
-            border: 1px solid #007ACC;
-            border-radius: 4px;
-            background-color: white;
-            color: #007ACC;
-            font-size: 12px;
-        }
+    # Signals
+    details_requested = Signal(dict)        # application_data
+    menu_requested = Signal(dict, QPoint)   # application_data, global_position
+    
+    BUTTONS = [("details", "Details"), ("actions", "Actions ▼")]
+    CARD_HEIGHT = 148
+    SPACING = 15  # between cards
+    MARGIN = 20   # left/right of the list
+    PADDING = 15  # inside the card
+    
+    def __init__(self, view: QListView):
+        super().__init__(view)
+        self._view = view
+        self._name_font = self._font(16, bold=True)
+        self._info_font = self._font(14)
+        self._small_font = self._font(12)
+        self._badge_font = self._font(12, bold=True)
+        self._badge_metrics = QFontMetrics(self._badge_font)
+        self._button_metrics = QFontMetrics(self._small_font)
+    
+    @staticmethod
+    def _font(pixel_size: int, bold: bool = False) -> QFont:
+        font = QFont()
+        font.setPixelSize(pixel_size)
+        font.setBold(bold)
+        return font
+    
+    def _card_rect(self, rect: QRect) -> QRect:
+        """Get the card area of a row (the row also holds the spacing around it)."""
+        return QRect(
+            rect.left() + self.MARGIN, rect.top() + self.SPACING // 2,
+            rect.width() - 2 * self.MARGIN, self.CARD_HEIGHT
+        )
+    
+    def _button_rects(self, rect: QRect) -> List[tuple]:
+        """Get the (button, rect) of each button at the bottom of a card."""
+        card = self._card_rect(rect)
+        left = card.left() + self.PADDING
+        top = card.bottom() - self.PADDING - 28
+        rects = []
+        for button, text in self.BUTTONS:
+            width = self._button_metrics.horizontalAdvance(text) + 24
+            rects.append((button, QRect(left, top, width, 28)))
+            left += width + 6
+        return rects
+    
+    def paint(self, painter, option, index):
+        card_state: CardState = index.data(ApplicationListModel.CardStateRole)
+        card = self._card_rect(option.rect)
+        hovered = bool(option.state & QStyle.StateFlag.State_MouseOver)
+        
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        
+        # Card frame
+        painter.setPen(QColor("#007ACC" if hovered else "#e9ecef"))
+        painter.setBrush(QColor("white"))
+        painter.drawRoundedRect(card.adjusted(0, 0, -1, -1), 8, 8)
+        content = card.adjusted(self.PADDING, self.PADDING, -self.PADDING, -self.PADDING)
+        
+        # State badge, right of the name
+        badge_width = self._badge_metrics.horizontalAdvance(card_state.state) + 16
+        badge = QRect(content.right() - badge_width, content.top(), badge_width, 24)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QColor(STATUS_COLORS.get(card_state.state, STATUS_COLORS['UNKNOWN'])))
+        painter.drawRoundedRect(badge, 12, 12)
+        painter.setFont(self._badge_font)
+        painter.setPen(QColor("white"))
+        painter.drawText(badge, Qt.AlignmentFlag.AlignCenter, card_state.state)
+        
+        # Name, type and zone, ID
+        painter.setFont(self._name_font)
+        painter.setPen(QColor("#212529"))
+        name_rect = QRect(content.left(), content.top(), content.width() - badge_width - 10, 24)
+        painter.drawText(name_rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, card_state.name)
+        
+        painter.setPen(QColor("#6c757d"))
+        painter.setFont(self._info_font)
+        painter.drawText(
+            QRect(content.left(), content.top() + 34, content.width(), 20),
+            Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+            f"📦 {card_state.instance_type} • 🌍 {card_state.zone}"
+        )
+        painter.setFont(self._small_font)
+        painter.drawText(
+            QRect(content.left(), content.top() + 64, content.width(), 16),
+            Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+            f"ID: {card_state.id[:12]}..."
+        )
         
-        #detailsButton:hover, #actionsButton:hover {
-            background-color: #007ACC;
-            color: white;
-        }
-        """)
+        # Buttons
+        painter.setBrush(QColor("white"))
+        for (button, rect), (_, text) in zip(self._button_rects(option.rect), self.BUTTONS):
+            painter.setPen(QColor("#007ACC"))
+            painter.drawRoundedRect(rect.adjusted(0, 0, -1, -1), 4, 4)
+            painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, text)
+        
+        painter.restore()
+    
+    def sizeHint(self, option, index) -> QSize:
+        return QSize(option.rect.width(), self.CARD_HEIGHT + self.SPACING)
+    
+    def editorEvent(self, event, model, option, index) -> bool:
+        if event.type() == QEvent.Type.MouseButtonRelease:
+            for button, rect in self._button_rects(option.rect):
+                if rect.contains(event.position().toPoint()):
+                    app_data = index.data(ApplicationListModel.AppDataRole)
+                    if button == "details":
+                        self.details_requested.emit(app_data)
+                    else:
+                        pos = self._view.viewport().mapToGlobal(rect.bottomLeft())
+                        self.menu_requested.emit(app_data, pos)
+                    return True
+        return super().editorEvent(event, model, option, index)
+
+
+@lru_cache(maxsize=512)
+def _format_epoch_date(seconds: int) -> str:
+    """Format whole Unix seconds as a local date, or return '' if out of range."""
+    try:
+        return datetime.fromtimestamp(seconds).strftime('%Y-%m-%d')
+    except (ValueError, OSError, OverflowError):
+        return ''
+
+
+def format_timestamp_date(timestamp: int) -> str:
+    """Format a Unix timestamp (seconds or milliseconds) as a date."""
+    # If timestamp is too large, it's probably in milliseconds; normalizing to whole
+    # seconds lets both units share cache entries and avoids float keys
+    seconds = timestamp // 1000 if timestamp > 1e10 else timestamp
+    # If conversion fails, show raw value
+    return _format_epoch_date(seconds) or str(timestamp)
+
+
+def read_environment_file(file_path: str) -> Dict[str, str]:
+    """Read variables from a .env or JSON file."""
+    data = Path(file_path).read_bytes()
+    if file_path.endswith('.json'):
+        return orjson.loads(data) if orjson else json.loads(data)
+    
+    # Assume .env format
+    return {
+        key: value.strip('"\'')
+        for key, value in ENV_LINE_RE.findall(data.decode('utf-8'))
+    }
+
+
+def write_environment_file(file_path: str, env_vars: Dict[str, str], as_json: bool):
+    """Write variables to a JSON or .env file."""
+    if as_json:
+        if orjson:
+            data = orjson.dumps(env_vars, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(env_vars, indent=2).encode('utf-8')
+    else:
+        data = "".join(f"{key}={value}\n" for key, value in env_vars.items()).encode('utf-8')
+    Path(file_path).write_bytes(data)
+
+
+class EnvironmentFileSignals(QObject):
+    """Signals of an EnvironmentFileTask (QRunnable cannot emit signals itself)."""
+    
+    finished = Signal(object, str)  # result, error
+
+
+class EnvironmentFileTask(QRunnable):
+    """Runs an environment file read or write on a thread pool."""
+    
+    def __init__(self, function):
+        super().__init__()
+        self.function = function
+        self.signals = EnvironmentFileSignals()
+    
+    def run(self):
+        try:
+            result = self.function()
+        except Exception as e:
+            self.signals.finished.emit(None, str(e))
+        else:
+            self.signals.finished.emit(result, "")
+
+
+class EnvironmentVariablesModel(QAbstractTableModel):
+    """Table model of environment variables: name, value, masked flag and actions."""
+    
+    # Signals
+    value_edited = Signal(str, str)  # var_name, value
+    
+    NAME_COLUMN, VALUE_COLUMN, MASKED_COLUMN, ACTIONS_COLUMN = range(4)
+    HEADERS = ["Name", "Value", "Masked", "Actions"]
+    MASK_TEXT = "••••••••"
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._names: List[str] = []
+        self._values: List[str] = []
+        self._masked: List[bool] = []
+    
+    def set_rows(self, rows: List[tuple]):
+        """Replace all rows with (name, value, masked) tuples."""
+        self.beginResetModel()
+        self._names = [row[0] for row in rows]
+        self._values = [row[1] for row in rows]
+        self._masked = [row[2] for row in rows]
+        self.endResetModel()
+    
+    def append_row(self, name: str, value: str, masked: bool):
+        """Append a single variable row."""
+        row = len(self._names)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._names.append(name)
+        self._values.append(value)
+        self._masked.append(masked)
+        self.endInsertRows()
+    
+    def remove_row(self, row: int):
+        """Remove a single variable row."""
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._names[row]
+        del self._values[row]
+        del self._masked[row]
+        self.endRemoveRows()
+    
+    def rename_row(self, row: int, name: str):
+        """Change the variable name of a row."""
+        self._names[row] = name
+        index = self.index(row, self.NAME_COLUMN)
+        self.dataChanged.emit(index, index)
+    
+    def variable_name(self, row: int) -> str:
+        """Get the variable name of a row."""
+        return self._names[row]
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._names)
+    
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def headerData(self, section: int, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+    
+    def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        row, column = index.row(), index.column()
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            if column == self.NAME_COLUMN:
+                return self._names[row]
+            if column == self.VALUE_COLUMN:
+                return self.MASK_TEXT if self._masked[row] else self._values[row]
+        elif role == Qt.ItemDataRole.CheckStateRole and column == self.MASKED_COLUMN:
+            return Qt.CheckState.Checked if self._masked[row] else Qt.CheckState.Unchecked
+        return None
+    
+    def flags(self, index: QModelIndex):
+        flags = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+        if index.column() == self.VALUE_COLUMN and not self._masked[index.row()]:
+            flags |= Qt.ItemFlag.ItemIsEditable
+        elif index.column() == self.MASKED_COLUMN:
+            flags |= Qt.ItemFlag.ItemIsUserCheckable
+        return flags
+    
+    def setData(self, index: QModelIndex, value, role=Qt.ItemDataRole.EditRole) -> bool:
+        if not index.isValid():
+            return False
+        
+        row, column = index.row(), index.column()
+        if column == self.VALUE_COLUMN and role == Qt.ItemDataRole.EditRole:
+            if value == self._values[row]:
+                return False
+            self._values[row] = value
+            self.dataChanged.emit(index, index)
+            self.value_edited.emit(self._names[row], value)
+            return True
+        
+        if column == self.MASKED_COLUMN and role == Qt.ItemDataRole.CheckStateRole:
+            self._masked[row] = Qt.CheckState(value) == Qt.CheckState.Checked
+            # Masking changes how the value cell is shown and whether it is editable
+            self.dataChanged.emit(index.siblingAtColumn(self.VALUE_COLUMN), index)
+            return True
+        
+        return False
+
+
+class EnvironmentActionsDelegate(QStyledItemDelegate):
+    """Paints the edit/delete buttons of the actions column without cell widgets."""
+    
+    # Signals
+    rename_requested = Signal(QModelIndex)
+    delete_requested = Signal(QModelIndex)
+    
+    BUTTONS = [("rename", "✏️"), ("delete", "🗑️")]
+    BUTTON_WIDTH = 30
+    MARGIN = 5
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._button_option = QStyleOptionButton()
+        self._button_option.iconSize = QSize(16, 16)
+        self._icons = {action: emoji_icon(emoji) for action, emoji in self.BUTTONS}
+        self._requests = {'rename': self.rename_requested, 'delete': self.delete_requested}
+    
+    def _button_rects(self, rect: QRect) -> List[tuple]:
+        """Get the (action, rect) of each button inside a cell."""
+        height = min(25, rect.height() - 4)
+        top = rect.top() + (rect.height() - height) // 2
+        left = rect.left() + self.MARGIN
+        rects = []
+        for action, _ in self.BUTTONS:
+            rects.append((action, QRect(left, top, self.BUTTON_WIDTH, height)))
+            left += self.BUTTON_WIDTH + self.MARGIN
+        return rects
+    
+    def paint(self, painter, option, index):
+        super().paint(painter, option, index)
+        style = option.widget.style() if option.widget else QApplication.style()
+        button = self._button_option
+        button.state = QStyle.StateFlag.State_Enabled
+        for action, rect in self._button_rects(option.rect):
+            button.rect = rect
+            button.icon = self._icons[action]
+            style.drawControl(QStyle.ControlElement.CE_PushButton, button, painter, option.widget)
+    
+    def sizeHint(self, option, index) -> QSize:
+        width = len(self.BUTTONS) * (self.BUTTON_WIDTH + self.MARGIN) + self.MARGIN
+        return QSize(width, 29)
+    
+    def editorEvent(self, event, model, option, index) -> bool:
+        if event.type() == QEvent.Type.MouseButtonRelease:
+            for action, rect in self._button_rects(option.rect):
+                if rect.contains(event.position().toPoint()):
+                    self._requests[action].emit(index)
+                    return True
+        return super().editorEvent(event, model, option, index)
 
 
 class EnvironmentVariablesEditor(QWidget):
@@ -209,9 +525,17 @@ class EnvironmentVariablesEditor(QWidget):
         super().__init__(parent)
         self.current_app_id = None
         self.current_env_vars = {}
-        self.original_env_vars = {}
+        self.original_env_vars: Mapping[str, str] = MappingProxyType({})  # read-only snapshot
         self.has_changes = False
-        self.logger = logging.getLogger(__name__)
+        self._dirty_keys = set()  # names whose current value differs from the original
+        self._file_tasks = set()  # running import/export tasks, kept alive until they report
+        self.logger = logger
+        
+        # Coalesce bursts of edits into a single variables_changed emission
+        self._changed_timer = QTimer(self)
+        self._changed_timer.setSingleShot(True)
+        self._changed_timer.setInterval(0)
+        self._changed_timer.timeout.connect(self._emit_variables_changed)
         self.setup_ui()
     
     def setup_ui(self):
@@ -246,21 +570,38 @@ class EnvironmentVariablesEditor(QWidget):
         layout.addLayout(header_layout)
         
         # Environment variables table
-        self.env_table = QTableWidget()
-        self.env_table.setColumnCount(4)
-        self.env_table.setHorizontalHeaderLabels(["Name", "Value", "Masked", "Actions"])
+        # Model and delegate live in this widget's thread, so their signals are
+        # connected directly; outward signals keep the default connection type
+        self.env_model = EnvironmentVariablesModel(self)
+        self.env_model.value_edited.connect(self._on_value_edited, Qt.ConnectionType.DirectConnection)
+        
+        self.env_table = QTableView()
+        self.env_table.setModel(self.env_model)
+        
+        self.actions_delegate = EnvironmentActionsDelegate(self.env_table)
+        self.actions_delegate.rename_requested.connect(self._on_rename_requested, Qt.ConnectionType.DirectConnection)
+        self.actions_delegate.delete_requested.connect(self._on_delete_requested, Qt.ConnectionType.DirectConnection)
+        self.env_table.setItemDelegateForColumn(EnvironmentVariablesModel.ACTIONS_COLUMN, self.actions_delegate)
         
         # Configure table
+        # Sized to contents once per population rather than on every change
         header = self.env_table.horizontalHeader()
-        header.setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)  # Name
-        header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)           # Value
-        header.setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)  # Masked
-        header.setSectionResizeMode(3, QHeaderView.ResizeMode.ResizeToContents)  # Actions
+        header.setSectionResizeMode(0, QHeaderView.ResizeMode.Interactive)  # Name
+        header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)      # Value
+        header.setSectionResizeMode(2, QHeaderView.ResizeMode.Interactive)  # Masked
+        header.setSectionResizeMode(3, QHeaderView.ResizeMode.Interactive)  # Actions
+        self.env_table.verticalHeader().setDefaultSectionSize(32)
         
         self.env_table.setAlternatingRowColors(True)
-        self.env_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.env_table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
         layout.addWidget(self.env_table)
         
+        # Placeholder shown instead of the table when no application is selected
+        self.empty_label = QLabel("Select an application to view environment variables")
+        self.empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.empty_label.setStyleSheet("color: #6c757d; padding: 20px;")
+        layout.addWidget(self.empty_label)
+        
         # Status and save section
         status_layout = QHBoxLayout()
         
@@ -304,12 +645,9 @@ class EnvironmentVariablesEditor(QWidget):
     
     def show_empty_state(self):
         """Show empty state when no application is selected."""
-        self.env_table.setRowCount(1)
-        empty_item = QTableWidgetItem("Select an application to view environment variables")
-        empty_item.setFlags(Qt.ItemFlag.NoItemFlags)
-        empty_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.env_table.setItem(0, 0, empty_item)
-        self.env_table.setSpan(0, 0, 1, 4)
+        self.env_model.set_rows([])
+        self.env_table.hide()
+        self.empty_label.show()
         
         # Disable controls
         self.add_btn.setEnabled(False)
@@ -318,117 +656,56 @@ class EnvironmentVariablesEditor(QWidget):
     
     def set_application(self, app_id: str, env_vars: Dict[str, str]):
         """Set the current application and its environment variables."""
-        self.logger.info(f"EnvironmentVariablesEditor.set_application called with app_id={app_id}, env_vars={env_vars}")
-        
         self.current_app_id = app_id
-        self.current_env_vars = env_vars.copy()
-        self.original_env_vars = env_vars.copy()
+        self.current_env_vars = dict(env_vars)
+        self.original_env_vars = MappingProxyType(dict(env_vars))
         self.has_changes = False
+        self._dirty_keys.clear()
         
         self.update_display()
         self.update_status()
         
         # Enable controls
+        self.empty_label.hide()
+        self.env_table.show()
         self.add_btn.setEnabled(True)
         self.import_btn.setEnabled(True)
         self.export_btn.setEnabled(True)
         
-        self.logger.info(f"Environment editor set for app {app_id} with {len(env_vars)} variables")
+        self.logger.info("Environment editor set for app %s with %d variables", app_id, len(env_vars))
     
     def update_display(self):
         """Update the table display with current environment variables."""
-        self.env_table.setRowCount(len(self.current_env_vars))
-        
-        for row, (name, value) in enumerate(self.current_env_vars.items()):
-            # Name column
-            name_item = QTableWidgetItem(name)
-            name_item.setFlags(Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable)
-            self.env_table.setItem(row, 0, name_item)
-            
-            # Value column (editable)
-            value_item = QTableWidgetItem(value)
-            value_item.setFlags(Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEditable)
-            self.env_table.setItem(row, 1, value_item)
-            
-            # Masked checkbox
-            mask_checkbox = QCheckBox()
-            mask_checkbox.setChecked(self._is_sensitive_var(name))
-            mask_checkbox.stateChanged.connect(lambda state, r=row: self._on_mask_changed(r, state))
-            self.env_table.setCellWidget(row, 2, mask_checkbox)
-            
-            # Actions column
-            actions_widget = self._create_actions_widget(row, name)
-            self.env_table.setCellWidget(row, 3, actions_widget)
-        
-        # Connect item changed signal
-        self.env_table.itemChanged.connect(self._on_item_changed)
-    
-    def _create_actions_widget(self, row: int, var_name: str) -> QWidget:
-        """Create actions widget for a table row."""
-        widget = QWidget()
-        layout = QHBoxLayout(widget)
-        layout.setContentsMargins(5, 2, 5, 2)
-        layout.setSpacing(5)
-        
-        # Edit button
-        edit_btn = QPushButton("✏️")
-        edit_btn.setToolTip("Edit variable name")
-        edit_btn.setMaximumSize(30, 25)
-        edit_btn.clicked.connect(lambda: self._edit_variable_name(row, var_name))
-        layout.addWidget(edit_btn)
-        
-        # Delete button
-        delete_btn = QPushButton("🗑️")
-        delete_btn.setToolTip("Delete variable")
-        delete_btn.setMaximumSize(30, 25)
-        delete_btn.clicked.connect(lambda: self._delete_variable(row, var_name))
-        layout.addWidget(delete_btn)
-        
-        layout.addStretch()
-        return widget
+        self.env_table.setUpdatesEnabled(False)
+        try:
+            self.env_model.set_rows([
+                (name, value, self._is_sensitive_var(name))
+                for name, value in self.current_env_vars.items()
+            ])
+            for column in (0, 2, 3):
+                self.env_table.resizeColumnToContents(column)
+        finally:
+            self.env_table.setUpdatesEnabled(True)
+    
+    def _on_rename_requested(self, index: QModelIndex):
+        """Handle a click on a row's rename button."""
+        self._edit_variable_name(index.row(), self.env_model.variable_name(index.row()))
+    
+    def _on_delete_requested(self, index: QModelIndex):
+        """Handle a click on a row's delete button."""
+        self._delete_variable(index.row(), self.env_model.variable_name(index.row()))
     
     def _is_sensitive_var(self, name: str) -> bool:
         """Check if a variable name suggests sensitive content."""
-        sensitive_keywords = [
-            'password', 'secret', 'key', 'token', 'auth', 'credential',
-            'private', 'pass', 'pwd', 'api_key', 'access_token'
-        ]
-        name_lower = name.lower()
-        return any(keyword in name_lower for keyword in sensitive_keywords)
-    
-    def _on_mask_changed(self, row: int, state: int):
-        """Handle mask checkbox state change."""
-        value_item = self.env_table.item(row, 1)
-        if value_item:
-            if state == Qt.CheckState.Checked.value:
-                # Mask the value
-                value_item.setText("••••••••")
-                value_item.setFlags(Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable)
-            else:
-                # Unmask the value
-                name_item = self.env_table.item(row, 0)
-                if name_item:
-                    var_name = name_item.text()
-                    actual_value = self.current_env_vars.get(var_name, "")
-                    value_item.setText(actual_value)
-                    value_item.setFlags(Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEditable)
-    
-    def _on_item_changed(self, item: QTableWidgetItem):
-        """Handle table item changes."""
-        if item.column() == 1:  # Value column
-            row = item.row()
-            name_item = self.env_table.item(row, 0)
-            if name_item:
-                var_name = name_item.text()
-                new_value = item.text()
-                
-                # Update current env vars
-                self.current_env_vars[var_name] = new_value
-                self._mark_changed()
+        return SENSITIVE_NAME_RE.search(name) is not None
+    
+    def _on_value_edited(self, var_name: str, value: str):
+        """Handle a value edited in the table."""
+        self.current_env_vars[var_name] = value
+        self._mark_changed(var_name)
     
     def _edit_variable_name(self, row: int, old_name: str):
         """Edit a variable name."""
-        from PySide6.QtWidgets import QInputDialog
         
         new_name, ok = QInputDialog.getText(
             self, 
@@ -442,13 +719,14 @@ class EnvironmentVariablesEditor(QWidget):
                 QMessageBox.warning(self, "Error", f"Variable '{new_name}' already exists!")
                 return
             
-            # Update the variable name
-            value = self.current_env_vars.pop(old_name)
-            self.current_env_vars[new_name] = value
-            
-            # Update display
-            self.update_display()
-            self._mark_changed()
+            # Update the variable name in place, keeping its position
+            self.current_env_vars = {
+                (new_name if name == old_name else name): value
+                for name, value in self.current_env_vars.items()
+            }
+            self.env_model.rename_row(row, new_name)
+            self.env_table.resizeColumnToContents(0)
+            self._mark_changed(old_name, new_name)
     
     def _delete_variable(self, row: int, var_name: str):
         """Delete a variable."""
@@ -456,18 +734,17 @@ class EnvironmentVariablesEditor(QWidget):
             self,
             "Delete Variable",
             f"Are you sure you want to delete the variable '{var_name}'?",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+            YES_NO_BUTTONS,
             QMessageBox.StandardButton.No
         )
         
         if reply == QMessageBox.StandardButton.Yes:
             self.current_env_vars.pop(var_name, None)
-            self.update_display()
-            self._mark_changed()
+            self.env_model.remove_row(row)
+            self._mark_changed(var_name)
     
     def add_variable(self):
         """Add a new environment variable."""
-        from PySide6.QtWidgets import QInputDialog
         
         name, ok = QInputDialog.getText(self, "Add Variable", "Variable name:")
         if not ok or not name:
@@ -480,8 +757,9 @@ class EnvironmentVariablesEditor(QWidget):
         value, ok = QInputDialog.getText(self, "Add Variable", f"Value for '{name}':")
         if ok:
             self.current_env_vars[name] = value
-            self.update_display()
-            self._mark_changed()
+            self.env_model.append_row(name, value, self._is_sensitive_var(name))
+            self.env_table.resizeColumnToContents(0)
+            self._mark_changed(name)
     
     def import_variables(self):
         """Import variables from a file."""
@@ -495,52 +773,46 @@ class EnvironmentVariablesEditor(QWidget):
         if not file_path:
             return
         
-        try:
-            imported_vars = {}
-            
-            if file_path.endswith('.json'):
-                import json
-                with open(file_path, 'r') as f:
-                    imported_vars = json.load(f)
-            else:
-                # Assume .env format
-                with open(file_path, 'r') as f:
-                    for line in f:
-                        line = line.strip()
-                        if line and not line.startswith('#') and '=' in line:
-                            key, value = line.split('=', 1)
-                            imported_vars[key.strip()] = value.strip().strip('"\'')
-            
-            if imported_vars:
-                # Ask about conflicts
-                conflicts = set(imported_vars.keys()) & set(self.current_env_vars.keys())
-                if conflicts:
-                    reply = QMessageBox.question(
-                        self,
-                        "Import Conflicts",
-                        f"The following variables already exist:\n{', '.join(conflicts)}\n\nOverwrite them?",
-                        QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-                        QMessageBox.StandardButton.No
-                    )
-                    
-                    if reply != QMessageBox.StandardButton.Yes:
-                        # Remove conflicts from import
-                        for conflict in conflicts:
-                            imported_vars.pop(conflict, None)
-                
-                # Import variables
-                self.current_env_vars.update(imported_vars)
-                self.update_display()
-                self._mark_changed()
-                
-                QMessageBox.information(
-                    self, 
-                    "Import Successful", 
-                    f"Imported {len(imported_vars)} variables."
-                )
+        self._start_file_task(
+            "Importing variables...",
+            partial(read_environment_file, file_path),
+            partial(self._on_import_finished, self.current_app_id)
+        )
+    
+    def _on_import_finished(self, app_id: str, imported_vars: Optional[Dict[str, str]], error: str):
+        """Merge variables read by an import task."""
+        if error:
+            QMessageBox.critical(self, "Import Error", f"Failed to import variables:\n{error}")
+            return
+        if app_id != self.current_app_id or not imported_vars:
+            return
+        
+        # Ask about conflicts
+        conflicts = set(imported_vars.keys()) & set(self.current_env_vars.keys())
+        if conflicts:
+            reply = QMessageBox.question(
+                self,
+                "Import Conflicts",
+                f"The following variables already exist:\n{', '.join(conflicts)}\n\nOverwrite them?",
+                YES_NO_BUTTONS,
+                QMessageBox.StandardButton.No
+            )
             
-        except Exception as e:
-            QMessageBox.critical(self, "Import Error", f"Failed to import variables:\n{str(e)}")
+            if reply != QMessageBox.StandardButton.Yes:
+                # Remove conflicts from import
+                for conflict in conflicts:
+                    imported_vars.pop(conflict, None)
+        
+        # Import variables
+        self.current_env_vars.update(imported_vars)
+        self.update_display()
+        self._mark_changed(*imported_vars)
+        
+        QMessageBox.information(
+            self, 
+            "Import Successful", 
+            f"Imported {len(imported_vars)} variables."
+        )
     
     def export_variables(self):
         """Export variables to a file."""
@@ -558,30 +830,60 @@ class EnvironmentVariablesEditor(QWidget):
         if not file_path:
             return
         
-        try:
-            if selected_filter.startswith("JSON"):
-                import json
-                with open(file_path, 'w') as f:
-                    json.dump(self.current_env_vars, f, indent=2)
-            else:
-                # Export as .env format
-                with open(file_path, 'w') as f:
-                    for key, value in self.current_env_vars.items():
-                        f.write(f"{key}={value}\n")
-            
-            QMessageBox.information(
-                self, 
-                "Export Successful", 
-                f"Exported {len(self.current_env_vars)} variables to {file_path}"
-            )
-            
-        except Exception as e:
-            QMessageBox.critical(self, "Export Error", f"Failed to export variables:\n{str(e)}")
+        env_vars = dict(self.current_env_vars)
+        self._start_file_task(
+            "Exporting variables...",
+            partial(write_environment_file, file_path, env_vars, selected_filter.startswith("JSON")),
+            partial(self._on_export_finished, file_path, len(env_vars))
+        )
+    
+    def _on_export_finished(self, file_path: str, count: int, result: Any, error: str):
+        """Report the outcome of an export task."""
+        if error:
+            QMessageBox.critical(self, "Export Error", f"Failed to export variables:\n{error}")
+            return
+        
+        QMessageBox.information(
+            self, 
+            "Export Successful", 
+            f"Exported {count} variables to {file_path}"
+        )
     
-    def _mark_changed(self):
-        """Mark that changes have been made."""
-        self.has_changes = True
+    def _start_file_task(self, label: str, function, callback):
+        """Run a file operation on the global thread pool behind a progress dialog."""
+        progress = QProgressDialog(label, "", 0, 0, self)
+        progress.setCancelButton(None)  # a running file operation cannot be interrupted
+        progress.setWindowModality(Qt.WindowModality.WindowModal)
+        progress.setMinimumDuration(500)  # only shown for slow files
+        
+        task = EnvironmentFileTask(function)
+        
+        def on_finished(result, error):
+            progress.close()
+            progress.deleteLater()
+            self._file_tasks.discard(task)
+            callback(result, error)
+        
+        task.signals.finished.connect(on_finished)
+        self._file_tasks.add(task)
+        progress.setValue(0)
+        QThreadPool.globalInstance().start(task)
+    
+    def _mark_changed(self, *var_names: str):
+        """Mark that the given variables have been changed, added or removed."""
+        missing = object()
+        for name in var_names:
+            if self.current_env_vars.get(name, missing) == self.original_env_vars.get(name, missing):
+                self._dirty_keys.discard(name)
+            else:
+                self._dirty_keys.add(name)
+        
+        self.has_changes = bool(self._dirty_keys)
         self.update_status()
+        self._changed_timer.start()
+    
+    def _emit_variables_changed(self):
+        """Emit the coalesced variables_changed signal."""
         self.variables_changed.emit(self.current_env_vars)
     
     def update_status(self):
@@ -592,8 +894,7 @@ class EnvironmentVariablesEditor(QWidget):
             self.save_btn.setEnabled(False)
             self.cancel_btn.setEnabled(False)
         else:
-            changes_count = len(set(self.current_env_vars.items()) - set(self.original_env_vars.items()))
-            self.status_label.setText(f"Unsaved changes ({changes_count} modified)")
+            self.status_label.setText(f"Unsaved changes ({len(self._dirty_keys)} modified)")
             self.status_label.setStyleSheet("color: #ffc107; font-weight: bold;")
             self.save_btn.setEnabled(True)
             self.cancel_btn.setEnabled(True)
@@ -610,20 +911,22 @@ class EnvironmentVariablesEditor(QWidget):
                 self,
                 "Cancel Changes",
                 "Are you sure you want to discard all changes?",
-                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+                YES_NO_BUTTONS,
                 QMessageBox.StandardButton.No
             )
             
             if reply == QMessageBox.StandardButton.Yes:
-                self.current_env_vars = self.original_env_vars.copy()
+                self.current_env_vars = dict(self.original_env_vars)
                 self.has_changes = False
+                self._dirty_keys.clear()
                 self.update_display()
                 self.update_status()
     
     def mark_saved(self):
         """Mark the current state as saved."""
-        self.original_env_vars = self.current_env_vars.copy()
+        self.original_env_vars = MappingProxyType(dict(self.current_env_vars))
         self.has_changes = False
+        self._dirty_keys.clear()
         self.update_status()
 
 
@@ -632,13 +935,60 @@ class ApplicationDetailsPanel(QWidget):
     
     # Signals
     action_requested = Signal(str, dict)  # action, application_data
+    environment_requested = Signal(str)   # app_id
+    environment_prefetch_requested = Signal(str)  # app_id, variables likely needed soon
+    logs_cleared = Signal()               # the logs view was emptied for another application
+    
+    # Maximum number of lines kept in the logs view
+    MAX_LOG_LINES = 5000
+    
+    # Milliseconds during which incoming log lines are gathered before display
+    LOG_FLUSH_INTERVAL = 100
+    
+    # Enabled flags of the (start, stop, restart) buttons by application state; others enable all
+    LIFECYCLE_BUTTONS = ('start', 'stop', 'restart')
+    LIFECYCLE_BUTTON_STATES = {
+        'RUNNING': (False, True, True),
+        'STOPPED': (True, False, False),
+    }
+    
+    # Rows of the information table: (label, field)
+    INFO_FIELDS = [
+        ("Name", "name"),
+        ("ID", "id"),
+        ("State", "state"),
+        ("Type", "instance_type"),
+        ("Zone", "zone"),
+        ("Created", "created_at"),
+        ("Last Deploy", "last_deploy")
+    ]
+    
+    # Quick action buttons, colored through their "action" property
+    ACTION_BUTTONS_STYLE = """
+        QPushButton[action] {
+            background-color: #007ACC;
+            color: white;
+            border: none;
+            border-radius: 4px;
+            padding: 10px 15px;
+            font-weight: bold;
+        }
+        QPushButton[action="start"] { background-color: #28a745; }
+        QPushButton[action="stop"] { background-color: #dc3545; }
+    """
     
     def __init__(self, api_client=None, parent=None):
         super().__init__(parent)
         self.api_client = api_client
         self.current_app = None
         self.current_org_id = None
-        self.logger = logging.getLogger(__name__)
+        self.logger = logger
+        
+        # Environment and logs tabs are built on first activation
+        self.env_editor: Optional[EnvironmentVariablesEditor] = None
+        self.logs_text: Optional[QPlainTextEdit] = None
+        self._env_app_id: Optional[str] = None  # application whose variables were requested
+        
         self.setup_ui()
     
     def setup_ui(self):
@@ -666,14 +1016,13 @@ class ApplicationDetailsPanel(QWidget):
         
         # Environment tab
         self.env_tab = QWidget()
-        self.setup_environment_tab()
         self.tabs.addTab(self.env_tab, "Environment")
         
         # Logs tab
         self.logs_tab = QWidget()
-        self.setup_logs_tab()
         self.tabs.addTab(self.logs_tab, "Logs")
         
+        self.tabs.currentChanged.connect(self._on_tab_changed)
         layout.addWidget(self.tabs)
         
         # Initially hide tabs
@@ -683,62 +1032,35 @@ class ApplicationDetailsPanel(QWidget):
         """Setup the overview tab."""
         layout = QVBoxLayout(self.overview_tab)
         
-        # Application info
+        # Application info, rendered as a single rich-text label
         self.info_group = QGroupBox("Application Information")
-        info_layout = QGridLayout(self.info_group)
-        
-        # Labels for info display
-        self.info_labels = {}
-        info_fields = [
-            ("Name", "name"),
-            ("ID", "id"),
-            ("State", "state"),
-            ("Type", "instance_type"),
-            ("Zone", "zone"),
-            ("Created", "created_at"),
-            ("Last Deploy", "last_deploy")
-        ]
+        info_layout = QVBoxLayout(self.info_group)
         
-        for i, (label, field) in enumerate(info_fields):
-            label_widget = QLabel(f"{label}:")
-            label_widget.setStyleSheet("font-weight: bold;")
-            value_widget = QLabel("-")
-            
-            info_layout.addWidget(label_widget, i, 0)
-            info_layout.addWidget(value_widget, i, 1)
-            
-            self.info_labels[field] = value_widget
+        self.info_label = QLabel()
+        self.info_label.setTextFormat(Qt.TextFormat.RichText)
+        self.info_label.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
+        self.info_label.setText(self._format_info({}))
+        info_layout.addWidget(self.info_label)
         
         layout.addWidget(self.info_group)
         
         # Actions
         actions_group = QGroupBox("Quick Actions")
+        actions_group.setStyleSheet(self.ACTION_BUTTONS_STYLE)
         actions_layout = QHBoxLayout(actions_group)
         
         self.action_buttons = {}
         actions = [
-            ("start", "▶️ Start", "#28a745"),
-            ("stop", "⏹️ Stop", "#dc3545"),
-            ("restart", "🔄 Restart", "#007ACC"),
-            ("deploy", "🚀 Deploy", "#007ACC")
+            ("start", "▶️ Start"),
+            ("stop", "⏹️ Stop"),
+            ("restart", "🔄 Restart"),
+            ("deploy", "🚀 Deploy")
         ]
         
-        for action_id, text, color in actions:
+        for action_id, text in actions:
             btn = QPushButton(text)
-            btn.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {color};
-                    color: white;
-                    border: none;
-                    border-radius: 4px;
-                    padding: 10px 15px;
-                    font-weight: bold;
-                }}
-                QPushButton:hover {{
-                    opacity: 0.8;
-                }}
-            """)
-            btn.clicked.connect(lambda checked, aid=action_id: self._on_action_clicked(aid))
+            btn.setProperty("action", action_id)
+            btn.clicked.connect(partial(self._on_action_clicked, action_id))
             actions_layout.addWidget(btn)
             self.action_buttons[action_id] = btn
         
@@ -759,28 +1081,79 @@ class ApplicationDetailsPanel(QWidget):
         """Setup the logs tab."""
         layout = QVBoxLayout(self.logs_tab)
         
-        # Logs display
-        self.logs_text = QTextEdit()
+        # Logs display, capped so memory stays bounded on long tails
+        self.logs_text = QPlainTextEdit()
         self.logs_text.setReadOnly(True)
-        self.logs_text.setPlainText("Application logs will be displayed here...")
+        self.logs_text.setUndoRedoEnabled(False)
+        self.logs_text.setMaximumBlockCount(self.MAX_LOG_LINES)
+        self.logs_text.setPlaceholderText("Application logs will be displayed here...")
         layout.addWidget(self.logs_text)
         
+        # Incoming lines are appended in batches
+        self._pending_log_lines: List[str] = []
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(self.LOG_FLUSH_INTERVAL)
+        self._log_flush_timer.timeout.connect(self._flush_log_lines)
+        
         # Refresh logs button
         refresh_btn = QPushButton("🔄 Refresh Logs")
         refresh_btn.clicked.connect(self._refresh_logs)
         layout.addWidget(refresh_btn)
     
+    def _on_tab_changed(self, index: int):
+        """Build the environment and logs tabs the first time they are shown."""
+        tab = self.tabs.widget(index)
+        if tab is self.env_tab:
+            if self.env_editor is None:
+                self.setup_environment_tab()
+            self._ensure_environment_loaded()
+        elif tab is self.logs_tab and self.logs_text is None:
+            self.setup_logs_tab()
+    
+    def _ensure_environment_loaded(self):
+        """Request environment variables of the current application if not done yet."""
+        app_id = self.current_app.get('id', '') if self.current_app else ''
+        if app_id and app_id != self._env_app_id:
+            self._env_app_id = app_id
+            self._load_environment_variables(app_id)
+    
+    def _queue_log_lines(self, lines: List[str]):
+        """Queue lines and schedule a flush if none is pending."""
+        self._pending_log_lines.extend(lines)
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
+    
+    def _flush_log_lines(self):
+        """Append all queued lines to the logs view at once."""
+        if self._pending_log_lines:
+            self.logs_text.appendPlainText('\n'.join(self._pending_log_lines))
+            self._pending_log_lines.clear()
+    
+    def append_log_lines(self, app_id: str, lines: List[str]) -> bool:
+        """Append fetched log lines if they belong to the current application; return whether they were."""
+        if self.logs_text is None or not self.current_app or self.current_app.get('id') != app_id:
+            return False
+        self._queue_log_lines(lines)
+        return True
+    
     def set_application(self, app_data: Dict[str, Any]):
         """Set the current application."""
+        if self.logs_text is not None and (not self.current_app or self.current_app.get('id') != app_data.get('id')):
+            self._pending_log_lines.clear()
+            self.logs_text.clear()
+            self.logs_cleared.emit()
         self.current_app = app_data
         self.update_display()
         self.tabs.show()
         
-        # Load environment variables for the editor
-        if hasattr(self, 'env_editor'):
-            app_id = app_data.get('id', '')
-            if app_id:
-                self._load_environment_variables(app_id)
+        # Reload environment variables if the editor is on screen,
+        # otherwise they are loaded when the tab is next opened
+        if self.tabs.currentWidget() is self.env_tab:
+            self._env_app_id = None
+            self._ensure_environment_loaded()
+        elif app_data.get('id'):
+            self.environment_prefetch_requested.emit(app_data['id'])
     
     def update_display(self):
         """Update the display with current application data."""
@@ -791,56 +1164,45 @@ class ApplicationDetailsPanel(QWidget):
         app_name = self.current_app.get('name', 'Unknown App')
         self.header_label.setText(f"Application: {app_name}")
         
-        # Update info labels
-        self.info_labels['name'].setText(self.current_app.get('name', '-'))
-        self.info_labels['id'].setText(self.current_app.get('id', '-'))
-        self.info_labels['state'].setText(self.current_app.get('state', '-'))
-        self.info_labels['instance_type'].setText(
-            self.current_app.get('instance', {}).get('type', '-')
-        )
-        self.info_labels['zone'].setText(self.current_app.get('zone', '-'))
+        # Update info table
+        info = {
+            'name': self.current_app.get('name', '-'),
+            'id': self.current_app.get('id', '-'),
+            'state': self.current_app.get('state', '-'),
+            'instance_type': self.current_app.get('instance', {}).get('type', '-'),
+            'zone': self.current_app.get('zone', '-'),
+        }
         
         # Format dates if available
         created_at = self.current_app.get('creationDate')
         if created_at:
             if isinstance(created_at, int):
-                # Convert Unix timestamp to date string
-                from datetime import datetime
-                try:
-                    # Try as seconds first
-                    if created_at > 1e10:  # If timestamp is too large, it's probably in milliseconds
-                        created_at = created_at / 1000
-                    date_str = datetime.fromtimestamp(created_at).strftime('%Y-%m-%d')
-                    self.info_labels['created_at'].setText(date_str)
-                except (ValueError, OSError):
-                    # If conversion fails, show raw value
-                    self.info_labels['created_at'].setText(str(created_at))
+                info['created_at'] = format_timestamp_date(created_at)
             elif isinstance(created_at, str):
-                self.info_labels['created_at'].setText(created_at[:10])  # Just date part
-            else:
-                self.info_labels['created_at'].setText('-')
-        else:
-            self.info_labels['created_at'].setText('-')
+                info['created_at'] = created_at[:10]  # Just date part
+        
+        self.info_label.setText(self._format_info(info))
         
         # Update action buttons based on state
         state = self.current_app.get('state', 'UNKNOWN')
         self._update_action_buttons(state)
     
+    def _format_info(self, info: Dict[str, str]) -> str:
+        """Render the information table as HTML, escaping API-provided values."""
+        rows = "".join(
+            f"<tr><td><b>{label}:</b></td><td>{escape(str(info.get(field) or '-'))}</td></tr>"
+            for label, field in self.INFO_FIELDS
+        )
+        return f"<table cellspacing='4'>{rows}</table>"
+    
     def _update_action_buttons(self, state: str):
         """Update action buttons based on application state."""
-        # Enable/disable buttons based on state
-        if state == 'RUNNING':
-            self.action_buttons['start'].setEnabled(False)
-            self.action_buttons['stop'].setEnabled(True)
-            self.action_buttons['restart'].setEnabled(True)
-        elif state == 'STOPPED':
-            self.action_buttons['start'].setEnabled(True)
-            self.action_buttons['stop'].setEnabled(False)
-            self.action_buttons['restart'].setEnabled(False)
-        else:
-            # Unknown state - enable all
-            for btn in self.action_buttons.values():
-                btn.setEnabled(True)
+        enabled_flags = self.LIFECYCLE_BUTTON_STATES.get(state, (True, True, True))
+        for action_id, enabled in zip(self.LIFECYCLE_BUTTONS, enabled_flags):
+            btn = self.action_buttons[action_id]
+            # Only touch buttons that change, each setEnabled re-polishes the style
+            if btn.isEnabled() != enabled:
+                btn.setEnabled(enabled)
     
     def _on_action_clicked(self, action_id: str):
         """Handle action button click."""
@@ -865,281 +1227,200 @@ class ApplicationDetailsPanel(QWidget):
         """Set a status message in the details panel."""
         # You could add a status label here if needed
         # For now, just log it
-        import logging
-        logger = logging.getLogger(__name__)
-        logger.info(f"Application details status: {message}")
+        self.logger.info(f"Application details status: {message}")
     
     def set_organization(self, org_id: str):
-        """Set the current organization and refresh applications."""
+        """Set the current organization used for environment lookups."""
         self.current_org_id = org_id
-        self.logger.info(f"Applications page: Organization changed to {org_id}")
-        
-        # Cancel any running threads first
-        if hasattr(self, 'apps_thread') and self.apps_thread.isRunning():
-            self.logger.info("Cancelling existing applications loading thread")
-            self.apps_thread.quit()
-            self.apps_thread.wait(3000)  # Wait up to 3 seconds
-            if self.apps_thread.isRunning():
-                self.logger.warning("Applications thread did not stop gracefully, terminating")
-                self.apps_thread.terminate()
-                self.apps_thread.wait(1000)
-        
-        # Cancel any running environment loading threads
-        for action_key, info in list(self.active_actions.items()):
-            thread = info['thread']
-            if thread.isRunning():
-                self.logger.info(f"Cancelling action thread: {action_key}")
-                thread.quit()
-                thread.wait(1000)
-                if thread.isRunning():
-                    thread.terminate()
-                    thread.wait(500)
-        self.active_actions.clear()
-        
-        # Update details panel with new organization
-        if hasattr(self, 'details_panel'):
-            self.details_panel.set_organization(org_id)
-            
-        # Only refresh if we have a valid organization
-        if org_id:
-            self.refresh_applications()
-        else:
-            # Clear display if no organization
-            self.applications = []
-            self.update_applications_display()
     
     def _load_environment_variables(self, app_id: str):
-        """Load environment variables for an application."""
-        if not self.api_client:
-            self.logger.error("No API client available for loading environment variables")
-            return
-            
-        # Create a worker to load environment variables
-        thread = QThread()
-        worker = EnvironmentLoader(self.api_client, app_id, self.current_org_id)
-        worker.moveToThread(thread)
-        
-        # Connect signals
-        worker.env_loaded.connect(self._on_env_loaded)
-        worker.env_error.connect(self._on_env_error)
-        thread.started.connect(worker.load_env)
-        
-        # Start thread
-        thread.start()
-        
-        # Store reference to clean up later
-        self._env_thread = thread
-        self._env_worker = worker
+        """Request environment variables for an application from the page."""
+        self.environment_requested.emit(app_id)
     
     def _on_env_loaded(self, app_id: str, env_vars: Dict[str, str]):
         """Handle successful environment variables loading."""
-        self.logger.info(f"Received {len(env_vars)} environment variables for app {app_id}: {list(env_vars.keys())}")
-        
-        if hasattr(self, 'env_editor'):
-            self.env_editor.set_application(app_id, env_vars)
+        if not self.current_app or self.current_app.get('id') != app_id:
+            return
         
-        # Cleanup thread
-        if hasattr(self, '_env_thread'):
-            self._env_thread.quit()
-            self._env_thread.wait()
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Received environment variables for app %s: %s", app_id, sorted(env_vars))
+        self.env_editor.set_application(app_id, env_vars)
     
     def _on_env_error(self, app_id: str, error: str):
         """Handle environment variables loading error."""
-        # Show placeholder data with error message
-        if hasattr(self, 'env_editor'):
-            placeholder_env = {
-                'ERROR': f'Failed to load environment variables: {error}'
-            }
-            self.env_editor.set_application(app_id, placeholder_env)
+        if not self.current_app or self.current_app.get('id') != app_id:
+            return
         
-        # Cleanup thread
-        if hasattr(self, '_env_thread'):
-            self._env_thread.quit()
-            self._env_thread.wait()
-
-
-class EnvironmentLoader(QObject):
-    """Worker class for loading environment variables."""
-    
-    # Signals
-    env_loaded = Signal(str, dict)  # app_id, env_vars
-    env_error = Signal(str, str)    # app_id, error
-    
-    def __init__(self, api_client: CleverCloudClient, app_id: str, org_id: Optional[str] = None):
-        super().__init__()
-        # Store the original client to copy its configuration
-        self.original_api_client = api_client
-        self.app_id = app_id
-        self.org_id = org_id
-        self.logger = logging.getLogger(__name__)
-    
-    def load_env(self):
-        """Load environment variables in thread."""
-        import asyncio
-        from clever_desktop.api.client import CleverCloudClient
-        
-        async def fetch_env():
-            # Create a new API client instance for this thread
-            api_client = None
-            try:
-                self.logger.info(f"Loading environment variables for app: {self.app_id} with org_id: {self.org_id}")
-                
-                # Create new API client with same auth
-                api_client = CleverCloudClient()
-                # Copy the auth token from the original client
-                if hasattr(self.original_api_client, 'auth') and self.original_api_client.auth.get_api_token():
-                    api_client.auth.api_token = self.original_api_client.auth.get_api_token()
-                
-                env_data = await api_client.get_application_env(self.app_id, self.org_id)
-                self.logger.info(f"Raw API response for env vars: {env_data}")
-                
-                # Convert API format to simple dict
-                env_vars = {}
-                if isinstance(env_data, list):
-                    # API returns directly [{"name": "...", "value": "..."}]
-                    for var in env_data:
-                        if isinstance(var, dict) and 'name' in var and 'value' in var:
-                            env_vars[var['name']] = var['value']
-                elif isinstance(env_data, dict) and 'env' in env_data:
-                    # API returns {"env": [{"name": "...", "value": "..."}], ...}
-                    for var in env_data.get('env', []):
-                        if isinstance(var, dict) and 'name' in var and 'value' in var:
-                            env_vars[var['name']] = var['value']
-                elif isinstance(env_data, dict):
-                    # API returns simple dict format
-                    env_vars = env_data
-                
-                self.logger.info(f"Loaded {len(env_vars)} environment variables")
-                return env_vars
-            except Exception as e:
-                self.logger.error(f"Failed to load environment variables: {e}")
-                raise e
-            finally:
-                # Clean up the API client
-                if api_client:
-                    try:
-                        await api_client.close()
-                    except:
-                        pass
+        # Allow a retry the next time the tab is opened
+        self._env_app_id = None
         
-        try:
-            # Create a new event loop for this thread
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
-            env_vars = loop.run_until_complete(fetch_env())
-            self.env_loaded.emit(self.app_id, env_vars)
-        except Exception as e:
-            self.env_error.emit(self.app_id, str(e))
-        finally:
-            # Clean up the event loop
-            try:
-                loop.close()
-            except:
-                pass
+        # Show placeholder data with error message
+        placeholder_env = {
+            'ERROR': f'Failed to load environment variables: {error}'
+        }
+        self.env_editor.set_application(app_id, placeholder_env)
 
 
-class ApplicationActionWorker(QObject):
-    """Worker class for application actions that need to run in a separate thread."""
+class StatusToast(QLabel):
+    """Non-modal message shown at the bottom-right of its parent, fading out after a while."""
     
-    # Signals
-    action_completed = Signal(str, str, bool, str)  # action, app_name, success, message
-    progress_updated = Signal(str)  # status message
+    DISPLAY_DURATION = 4000  # ms before fading out
+    FADE_DURATION = 400
+    COLORS = {'success': '#28a745', 'error': '#dc3545', 'info': '#007ACC'}
+    MARGIN = 20
     
-    def __init__(self, api_client: CleverCloudClient, action: str, app_id: str, app_name: str, env_vars: Optional[Dict[str, str]] = None):
-        super().__init__()
-        # Store the original client to copy its configuration
-        self.original_api_client = api_client
-        self.action = action
-        self.app_id = app_id
-        self.app_name = app_name
-        self.env_vars = env_vars
-        self.logger = logging.getLogger(__name__)
-    
-    def execute_action(self):
-        """Execute the application action."""
-        import asyncio
-        from clever_desktop.api.client import CleverCloudClient
-        
-        async def run_action():
-            # Create a new API client instance for this thread
-            api_client = None
-            try:
-                self.progress_updated.emit(f"{self.action.capitalize()}ing {self.app_name}...")
-                self.logger.info(f"Executing {self.action} for application {self.app_name} (ID: {self.app_id})")
-                
-                # Create new API client with same auth
-                api_client = CleverCloudClient()
-                # Copy the auth token from the original client
-                if hasattr(self.original_api_client, 'auth') and self.original_api_client.auth.get_api_token():
-                    api_client.auth.api_token = self.original_api_client.auth.get_api_token()
-                
-                if self.action == 'start':
-                    await api_client.start_application(self.app_id)
-                    message = f"Application '{self.app_name}' started successfully."
-                elif self.action == 'stop':
-                    await api_client.stop_application(self.app_id)
-                    message = f"Application '{self.app_name}' stopped successfully."
-                elif self.action == 'restart':
-                    await api_client.restart_application(self.app_id)
-                    message = f"Application '{self.app_name}' restarted successfully."
-                elif self.action == 'save_environment':
-                    if self.env_vars is not None:
-                        await api_client.set_application_env(self.app_id, self.env_vars)
-                        message = f"Environment variables for '{self.app_name}' saved successfully."
-                    else:
-                        raise ValueError("No environment variables provided for save operation")
-                else:
-                    raise ValueError(f"Unknown action: {self.action}")
-                
-                self.logger.info(f"Action {self.action} completed successfully for {self.app_name}")
-                self.action_completed.emit(self.action, self.app_name, True, message)
-                
-            except Exception as e:
-                error_msg = f"Failed to {self.action} application '{self.app_name}': {str(e)}"
-                self.logger.error(error_msg)
-                self.action_completed.emit(self.action, self.app_name, False, error_msg)
-            finally:
-                # Clean up the API client
-                if api_client:
-                    try:
-                        await api_client.close()
-                    except:
-                        pass
+    def __init__(self, parent: QWidget):
+        super().__init__(parent)
+        self.setWordWrap(True)
+        self.setMaximumWidth(360)
+        
+        # windowOpacity only applies to top-level windows, so fade through an effect
+        self._opacity = QGraphicsOpacityEffect(self)
+        self.setGraphicsEffect(self._opacity)
+        self._fade = QPropertyAnimation(self._opacity, b"opacity", self)
+        self._fade.setDuration(self.FADE_DURATION)
+        self._fade.setStartValue(1.0)
+        self._fade.setEndValue(0.0)
+        self._fade.finished.connect(self.hide)
+        
+        self._hide_timer = QTimer(self)
+        self._hide_timer.setSingleShot(True)
+        self._hide_timer.timeout.connect(self._fade.start)
+        self.hide()
+    
+    def show_success(self, message: str):
+        self._show_message(message, 'success')
+    
+    def show_error(self, message: str):
+        self._show_message(message, 'error')
+    
+    def show_info(self, message: str):
+        self._show_message(message, 'info')
+    
+    def _show_message(self, message: str, kind: str):
+        """Show a message, replacing the current one."""
+        self._fade.stop()
+        self._opacity.setOpacity(1.0)
+        self.setText(message)
+        self.setStyleSheet(f"""
+            background-color: {self.COLORS[kind]};
+            color: white;
+            padding: 10px 14px;
+            border-radius: 6px;
+            font-weight: bold;
+        """)
+        self.adjustSize()
         
-        try:
-            # Create a new event loop for this thread
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
-            # Run the async function in this thread
-            loop.run_until_complete(run_action())
-        except Exception as e:
-            error_msg = f"Thread execution failed for {self.action}: {str(e)}"
-            self.logger.error(error_msg)
-            self.action_completed.emit(self.action, self.app_name, False, error_msg)
-        finally:
-            # Clean up the event loop
-            try:
-                loop.close()
-            except:
-                pass
+        parent = self.parentWidget()
+        self.move(parent.width() - self.width() - self.MARGIN, parent.height() - self.height() - self.MARGIN)
+        self.raise_()
+        self.show()
+        self._hide_timer.start(self.DISPLAY_DURATION)
 
 
 class ApplicationsPage(QWidget):
     """Applications management page."""
     
+    # Seconds during which loaded data is considered fresh on showEvent
+    SHOW_REFRESH_TTL = 30
+    
+    # Seconds during which fetched listings are served from the I/O loop's caches
+    APPS_CACHE_TTL = 15
+    ENV_CACHE_TTL = 30
+    ENV_CACHE_SIZE = 32  # applications whose variables are kept, oldest fetch evicted first
+    
+    # Milliseconds an application must stay selected or hovered before its variables are prefetched
+    PREFETCH_DELAY = 200
+    
+    # Auto-refresh interval (ms), doubled after each unchanged refresh up to the maximum
+    REFRESH_INTERVAL = 60000
+    MAX_REFRESH_INTERVAL = 600000
+    
+    # State an application enters once a lifecycle action has been accepted by the API
+    ACTION_STATES = {
+        'start': 'DEPLOYING',
+        'stop': 'STOPPED',
+        'restart': 'RESTARTING',
+    }
+    
+    # Actions that ask for confirmation before running
+    CONFIRMED_ACTIONS = frozenset({'stop', 'restart'})
+    
+    # Lifecycle actions offered in the actions menu by application state
+    MENU_LIFECYCLE_ACTIONS = {
+        'RUNNING': ('restart', 'stop'),
+        'STOPPED': ('start',),
+    }
+    
+    # Signals (emitted from the I/O loop thread, delivered queued to the GUI thread)
+    applications_loaded = Signal(str, list)  # org_id, applications
+    applications_error = Signal(str, str)    # org_id, error
+    logs_loaded = Signal(str, list, str)     # app_id, log lines, timestamp of the last line
+    environment_loaded = Signal(str, dict)   # app_id, env_vars
+    environment_error = Signal(str, str)     # app_id, error
+    action_progress = Signal(str)            # status message
+    application_updated = Signal(dict)       # partial application data, with its id
+    action_completed = Signal(object)            # ActionResult
+    environment_save_completed = Signal(object)  # ActionResult
+    
     def __init__(self, api_client: CleverCloudClient, parent=None):
         super().__init__(parent)
         self.api_client = api_client
-        self.logger = logging.getLogger(__name__)
+        self.logger = logger
+        
+        # Response caches, only touched from the I/O loop: key -> (time.monotonic(), value)
+        self._apps_cache: Dict[tuple, tuple] = {}  # (org_id,) -> applications
+        self._env_cache: Dict[tuple, tuple] = {}   # (org_id, app_id) -> env_vars
+        self._env_requests: Dict[tuple, asyncio.Task] = {}  # (org_id, app_id) -> fetch in flight
+        
+        self.applications_loaded.connect(self._on_applications_loaded)
+        self.applications_error.connect(self._on_applications_error)
+        self.logs_loaded.connect(self._on_logs_loaded)
+        self.action_progress.connect(self._on_action_progress)
+        self.application_updated.connect(self._on_application_updated)
+        self.action_completed.connect(self._on_action_completed)
+        self.environment_save_completed.connect(self._on_environment_save_completed)
+        
+        # Actions menus shared by all application cards, one per state, built on first use
+        self._menus_by_state: Dict[str, QMenu] = {}
+        self._menu_actions: Dict[str, QAction] = {}
+        self._menu_app: Optional[Dict[str, Any]] = None
+        
+        # Environment prefetch of the last selected or hovered application
+        self._prefetch_app_id: Optional[str] = None
+        self._prefetch_timer = QTimer(self)
+        self._prefetch_timer.setSingleShot(True)
+        self._prefetch_timer.setInterval(self.PREFETCH_DELAY)
+        self._prefetch_timer.timeout.connect(self._run_prefetch)
+        
+        # Action dispatch table: action -> handler(app_id, app_name)
+        self._action_dispatch = {
+            'start': partial(self._execute_application_action, 'start'),
+            'stop': partial(self._execute_application_action, 'stop'),
+            'restart': partial(self._execute_application_action, 'restart'),
+            'deploy': self.deploy_application,
+            'logs': self.view_logs,
+            'environment': self.manage_environment,
+            'delete': self.delete_application,
+            'refresh_logs': self.refresh_logs,
+        }
         
         # Data
         self.current_org_id = None  # Will be set when organization is selected
         self.applications = []
         
-        # Action tracking
-        self.active_actions = {}  # action_id -> thread info
+        self._last_load = 0.0  # time.monotonic() of the last successful load
+        self._logs_since: Optional[tuple] = None  # (app_id, timestamp of last fetched log line)
+        
+        # Action tracking: (action, app_id) of the actions running on the I/O loop
+        self._in_flight: Set[Tuple[str, str]] = set()
+        
+        # Coalesce bursts of refresh requests (show, org switch, polling) into one load
+        self._refresh_force = False
+        self._refresh_debounce = QTimer(self)
+        self._refresh_debounce.setSingleShot(True)
+        self._refresh_debounce.setInterval(150)
+        self._refresh_debounce.timeout.connect(self._do_refresh_applications)
         
         self.setup_ui()
         self.setup_refresh_timer()
@@ -1171,11 +1452,18 @@ class ApplicationsPage(QWidget):
         self.search_input.setPlaceholderText("Search applications...")
         self.search_input.setMinimumWidth(200)
         self.search_input.textChanged.connect(self.filter_applications)
+        
+        # Filter once the user pauses typing rather than on every keystroke
+        self._filter_text = ""
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(150)
+        self._filter_timer.timeout.connect(self._apply_filter)
         header_layout.addWidget(self.search_input)
         
         # View toggle (could add table/grid view toggle here)
         self.refresh_btn = QPushButton("🔄 Refresh")
-        self.refresh_btn.clicked.connect(self.refresh_applications)
+        self.refresh_btn.clicked.connect(partial(self.refresh_applications, force_refresh=True))
         header_layout.addWidget(self.refresh_btn)
         
         # Create new app button
@@ -1201,28 +1489,54 @@ class ApplicationsPage(QWidget):
         # Main content area with splitter
         splitter = QSplitter(Qt.Orientation.Horizontal)
         
-        # Applications list/grid
-        self.apps_scroll = QScrollArea()
-        self.apps_scroll.setWidgetResizable(True)
-        self.apps_scroll.setMinimumWidth(400)
-        
-        self.apps_container = QWidget()
-        self.apps_layout = QVBoxLayout(self.apps_container)
-        self.apps_layout.setContentsMargins(20, 10, 20, 20)
-        self.apps_layout.setSpacing(15)
+        # Applications list: cards are painted by a delegate, so only visible rows cost anything
+        apps_panel = QWidget()
+        apps_panel.setMinimumWidth(400)
+        apps_layout = QVBoxLayout(apps_panel)
+        apps_layout.setContentsMargins(0, 10, 0, 0)
         
         # Loading label
         self.loading_label = QLabel("Loading applications...")
         self.loading_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.loading_label.setStyleSheet("color: #6c757d; font-size: 16px; padding: 50px;")
-        self.apps_layout.addWidget(self.loading_label)
-        
-        self.apps_scroll.setWidget(self.apps_container)
-        splitter.addWidget(self.apps_scroll)
+        apps_layout.addWidget(self.loading_label)
+        
+        self.no_apps_label = QLabel("No applications found")
+        self.no_apps_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.no_apps_label.setStyleSheet("color: #6c757d; font-size: 16px; padding: 50px;")
+        self.no_apps_label.hide()
+        apps_layout.addWidget(self.no_apps_label)
+        
+        self.apps_model = ApplicationListModel(self)
+        self.apps_proxy = QSortFilterProxyModel(self)
+        self.apps_proxy.setSourceModel(self.apps_model)
+        self.apps_proxy.setFilterRole(ApplicationListModel.SearchRole)
+        
+        self.apps_view = QListView()
+        self.apps_view.setModel(self.apps_proxy)
+        self.apps_view.setFrameShape(QFrame.Shape.NoFrame)
+        self.apps_view.setSelectionMode(QListView.SelectionMode.NoSelection)
+        self.apps_view.setVerticalScrollMode(QListView.ScrollMode.ScrollPerPixel)
+        self.apps_view.setUniformItemSizes(True)
+        self.apps_view.setMouseTracking(True)  # hover highlight of the cards
+        self.apps_view.entered.connect(self._on_application_hovered)
+        self.apps_view.setStyleSheet("QListView { background-color: #f8f9fa; }")
+        self.apps_delegate = ApplicationCardDelegate(self.apps_view)
+        self.apps_delegate.menu_requested.connect(self._show_actions_menu)
+        self.apps_view.setItemDelegate(self.apps_delegate)
+        apps_layout.addWidget(self.apps_view)
+        
+        splitter.addWidget(apps_panel)
         
         # Details panel
         self.details_panel = ApplicationDetailsPanel(api_client=self.api_client)
+        self.apps_delegate.details_requested.connect(self.details_panel.set_application)
         self.details_panel.action_requested.connect(self.handle_application_action)
+        self.details_panel.environment_requested.connect(self.load_environment)
+        self.details_panel.environment_prefetch_requested.connect(self.prefetch_environment)
+        self.details_panel.logs_cleared.connect(self._on_logs_cleared)
+        self.environment_loaded.connect(self.details_panel._on_env_loaded)
+        self.environment_error.connect(self.details_panel._on_env_error)
         splitter.addWidget(self.details_panel)
         
         # Set splitter proportions
@@ -1230,168 +1544,225 @@ class ApplicationsPage(QWidget):
         
         layout.addWidget(splitter)
         
+        # Action results are reported without blocking the event loop
+        self._toast = StatusToast(self)
+        
         # Load applications
         self.refresh_applications()
     
+    def _setup_menu_actions(self):
+        """Create the menu actions shared by all application cards."""
+        entries = [
+            ("restart", "🔄", "Restart"),
+            ("stop", "⏹️", "Stop"),
+            ("start", "▶️", "Start"),
+            ("logs", "📋", "View Logs"),
+            ("environment", "⚙️", "Environment"),
+            ("deploy", "🚀", "Deploy"),
+            ("delete", "🗑️", "Delete"),
+        ]
+        for action_id, emoji, text in entries:
+            action = QAction(emoji_icon(emoji), text, self)
+            action.triggered.connect(partial(self._on_menu_action, action_id))
+            self._menu_actions[action_id] = action
+    
+    def _actions_menu_for_state(self, state: str) -> QMenu:
+        """Get the actions menu for an application state, building it on first use."""
+        key = state if state in self.MENU_LIFECYCLE_ACTIONS else 'OTHER'
+        menu = self._menus_by_state.get(key)
+        if menu is None:
+            if not self._menu_actions:
+                self._setup_menu_actions()
+            
+            menu = QMenu(self)
+            lifecycle = self.MENU_LIFECYCLE_ACTIONS.get(key, ())
+            for action_id in lifecycle:
+                menu.addAction(self._menu_actions[action_id])
+            if lifecycle:
+                menu.addSeparator()
+            for action_id in ('logs', 'environment', 'deploy'):
+                menu.addAction(self._menu_actions[action_id])
+            menu.addSeparator()
+            menu.addAction(self._menu_actions['delete'])
+            self._menus_by_state[key] = menu
+        return menu
+    
+    def _show_actions_menu(self, app_data: Dict[str, Any], pos: QPoint):
+        """Show the actions menu matching an application card's state."""
+        menu = self._actions_menu_for_state(app_data.get('state', 'UNKNOWN'))
+        self._menu_app = app_data
+        menu.exec(pos)
+    
+    def _on_menu_action(self, action_id: str):
+        """Dispatch an action picked from the shared actions menu."""
+        if self._menu_app is not None:
+            self.handle_application_action(action_id, self._menu_app)
+    
     def setup_refresh_timer(self):
-        """Setup automatic refresh timer."""
-        self.refresh_timer = QTimer()
+        """Setup automatic refresh timer (only runs while the page is visible)."""
+        self._current_interval = self.REFRESH_INTERVAL
+        self._last_hash: Optional[int] = None  # hash of (id, state) pairs from the last load
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setInterval(self._current_interval)
         self.refresh_timer.timeout.connect(self.refresh_applications)
-        self.refresh_timer.start(60000)  # Refresh every minute
     
-    def refresh_applications(self):
-        """Refresh applications list."""
+    def _update_refresh_interval(self, applications: list):
+        """Back off polling while the loaded applications stay unchanged."""
+        h = hash(tuple((app.get('id'), app.get('state')) for app in applications))
+        if h == self._last_hash:
+            self._current_interval = min(self._current_interval * 2, self.MAX_REFRESH_INTERVAL)
+        else:
+            self._current_interval = self.REFRESH_INTERVAL
+        self._last_hash = h
+        self.refresh_timer.setInterval(self._current_interval)
+    
+    def refresh_applications(self, force_refresh: bool = False):
+        """Schedule a refresh of the applications list, bypassing the listings cache if force_refresh is set."""
+        self._refresh_force = self._refresh_force or force_refresh
+        self._refresh_debounce.start()
+    
+    def _do_refresh_applications(self):
+        """Run the refresh requested during the last debounce window."""
+        force_refresh, self._refresh_force = self._refresh_force, False
         if not self.current_org_id:
             self.logger.warning("Cannot refresh applications: No organization selected")
             return
             
         self.logger.info(f"Refreshing applications for organization: {self.current_org_id}")
-        self._refresh_applications_async()
+        self._refresh_applications_async(force_refresh)
     
-    def _refresh_applications_async(self):
-        """Refresh applications using a separate thread."""
-        from PySide6.QtCore import QThread, QObject, Signal
+    def set_organization(self, org_id: str):
+        """Set the current organization and refresh applications."""
+        self.current_org_id = org_id
+        self.logger.info(f"Applications page: Organization changed to {org_id}")
         
-        class ApplicationsLoader(QObject):
-            data_loaded = Signal(list)  # applications
-            error_occurred = Signal(str)
-            
-            def __init__(self, api_client, org_id, logger):
-                super().__init__()
-                self.api_client = api_client
-                self.org_id = org_id
-                self.logger = logger
-            
-            def load_data(self):
-                """Load applications in thread."""
-                import asyncio
-                from clever_desktop.api.client import CleverCloudClient
-                
-                async def fetch_applications():
-                    # Create a new API client instance for this thread
-                    api_client = None
-                    try:
-                        self.logger.info(f"Loading applications from API for org: {self.org_id}")
-                        
-                        # Create new API client with same auth
-                        api_client = CleverCloudClient()
-                        # Copy the auth token from the original client
-                        if hasattr(self.api_client, 'auth') and self.api_client.auth.get_api_token():
-                            api_client.auth.api_token = self.api_client.auth.get_api_token()
-                        
-                        # Get applications from API for current organization
-                        if self.org_id:
-                            applications = await api_client.get_applications(self.org_id)
-                        else:
-                            # Fallback to all applications if no org selected
-                            applications = await api_client.get_applications()
-                        
-                        self.logger.info(f"Loaded {len(applications)} applications from API")
-                        return applications
-                        
-                    except Exception as e:
-                        self.logger.error(f"Failed to load applications: {e}")
-                        raise e
-                    finally:
-                        # Clean up the API client
-                        if api_client:
-                            try:
-                                await api_client.close()
-                            except:
-                                pass
-                
-                try:
-                    # Create a new event loop for this thread
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-                    
-                    # Run async code in this thread
-                    applications = loop.run_until_complete(fetch_applications())
-                    self.data_loaded.emit(applications)
-                except Exception as e:
-                    self.error_occurred.emit(str(e))
-                finally:
-                    # Clean up the event loop
-                    try:
-                        loop.close()
-                    except:
-                        pass
+        # Forget running actions; they finish on the I/O loop and still report
+        self._in_flight.clear()
+        
+        # Update details panel with new organization
+        self.details_panel.set_organization(org_id)
         
+        # Reset the search for the new organization without triggering a filter pass
+        with QSignalBlocker(self.search_input):
+            self.search_input.clear()
+        self.filter_applications("")
+        
+        # Only refresh if we have a valid organization
+        if org_id:
+            self.refresh_applications()
+        else:
+            # Clear display if no organization
+            self.applications = []
+            self.update_applications_display()
+    
+    def _refresh_applications_async(self, force_refresh: bool = False):
+        """Refresh applications on the background I/O loop."""
         # Show loading
         self.loading_label.setText("Loading applications...")
         self.loading_label.show()
         
-        # Create thread and loader
-        if hasattr(self, 'apps_thread') and self.apps_thread.isRunning():
-            self.apps_thread.quit()
-            self.apps_thread.wait()
+        org_id = self.current_org_id
+        future = io_loop.submit(self._fetch_applications(org_id, force_refresh))
+        future.add_done_callback(partial(self._on_applications_future_done, org_id))
+        self.logger.info("Scheduled applications loading on I/O loop")
+    
+    def _cache_get(self, cache: Dict[tuple, tuple], key: tuple, ttl: float) -> Optional[Any]:
+        """Return a cached value younger than ttl seconds (runs on the I/O loop)."""
+        entry = cache.get(key)
+        if entry is not None and time.monotonic() - entry[0] < ttl:
+            return entry[1]
+        return None
+    
+    def _cached_environment(self, app_id: str) -> Optional[Dict[str, str]]:
+        """Return a fresh cached snapshot of an application's variables (runs on the I/O loop)."""
+        for key in self._env_cache:
+            if key[1] == app_id:
+                return self._cache_get(self._env_cache, key, self.ENV_CACHE_TTL)
+        return None
+    
+    def _update_caches(self, action: str, app_id: str, env_vars: Optional[Dict[str, str]] = None):
+        """Refresh or drop cached listings affected by an action (runs on the I/O loop)."""
+        if action == 'save_environment':
+            # The PUT replaced the whole set, so the saved dict is the new snapshot
+            entry = (time.monotonic(), dict(env_vars))
+            for key in self._env_cache:
+                if key[1] == app_id:
+                    self._env_cache[key] = entry
+        else:
+            self._apps_cache.clear()
+    
+    async def _fetch_applications(self, org_id: Optional[str], force_refresh: bool = False) -> List[Dict[str, Any]]:
+        """Load applications from the API (runs on the I/O loop)."""
+        key = (org_id,)
+        if not force_refresh:
+            applications = self._cache_get(self._apps_cache, key, self.APPS_CACHE_TTL)
+            if applications is not None:
+                self.logger.debug("Applications for org %s served from cache", org_id)
+                return applications
+        
+        self.logger.info("Loading applications from API for org: %s", org_id)
+        api_client = await io_loop.get_client(self.api_client)
+        applications = await api_client.get_applications(org_id, use_cache=False)
+        self._apps_cache[key] = (time.monotonic(), applications)
+        self.logger.info("Loaded %d applications from API", len(applications))
+        return applications
+    
+    def _on_applications_future_done(self, org_id: str, future: Future):
+        """Forward a finished applications fetch to the GUI thread."""
+        if future.cancelled():
+            return  # dropped at worker loop shutdown
+        try:
+            applications = future.result()
+        except Exception as e:
+            self.applications_error.emit(org_id, str(e))
+        else:
+            self.applications_loaded.emit(org_id, applications)
+    
+    def _on_applications_loaded(self, org_id: str, applications: list):
+        """Handle successful applications loading."""
+        if org_id != self.current_org_id:
+            self.logger.info(f"Ignoring applications loaded for previous organization {org_id}")
+            return
         
-        self.apps_thread = QThread()
-        self.apps_loader = ApplicationsLoader(self.api_client, self.current_org_id, self.logger)
-        self.apps_loader.moveToThread(self.apps_thread)
+        self._update_refresh_interval(applications)
+        self._last_load = time.monotonic()
         
-        # Connect signals
-        self.apps_loader.data_loaded.connect(self._on_applications_loaded)
-        self.apps_loader.error_occurred.connect(self._on_applications_error)
-        self.apps_thread.started.connect(self.apps_loader.load_data)
+        if applications == self.applications:
+            # Served from cache: the cards on screen are already up to date
+            self.loading_label.hide()
+            return
         
-        # Start thread
-        self.apps_thread.start()
-        self.logger.info("Started applications loading thread")
-    
-    def _on_applications_loaded(self, applications: list):
-        """Handle successful applications loading."""
-        self.logger.info(f"Applications loading completed: {len(applications)} applications")
+        self.logger.info("Applications loading completed: %d applications", len(applications))
         
         # Store applications
         self.applications = applications
         
         # Update display
         self.update_applications_display()
-        
-        # Cleanup thread
-        self.apps_thread.quit()
-        self.apps_thread.wait()
     
-    def _on_applications_error(self, error: str):
+    def _on_applications_error(self, org_id: str, error: str):
         """Handle applications loading error."""
+        if org_id != self.current_org_id:
+            return
+        
         self.logger.error(f"Applications loading failed: {error}")
         self.loading_label.setText(f"Error loading applications: {error}")
-        
-        # Cleanup thread
-        self.apps_thread.quit()
-        self.apps_thread.wait()
     
     def update_applications_display(self):
-        """Update the applications display."""
-        # Clear existing cards
-        for i in reversed(range(self.apps_layout.count())):
-            child = self.apps_layout.itemAt(i).widget()
-            if child:
-                child.setParent(None)
-        
-        if not self.applications:
-            no_apps_label = QLabel("No applications found")
-            no_apps_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            no_apps_label.setStyleSheet("color: #6c757d; font-size: 16px; padding: 50px;")
-            self.apps_layout.addWidget(no_apps_label)
-            return
-        
-        # Add application cards
-        for app in self.applications:
-            card = ApplicationCard(app)
-            card.application_selected.connect(self.details_panel.set_application)
-            card.action_requested.connect(self.handle_application_action)
-            self.apps_layout.addWidget(card)
-        
-        # Add stretch to push cards to top
-        self.apps_layout.addStretch()
+        """Update the applications display (only changed rows are repainted)."""
+        self.loading_label.hide()
+        self.no_apps_label.setVisible(not self.applications)
+        self.apps_view.setVisible(bool(self.applications))
+        self.apps_model.set_applications(self.applications)
     
     def filter_applications(self, search_text: str):
-        """Filter applications based on search text."""
-        # This would filter the displayed applications
-        # For now, just a placeholder
-        pass
+        """Filter applications based on search text (debounced)."""
+        self._filter_text = search_text.strip().casefold()
+        self._filter_timer.start()
+    
+    def _apply_filter(self):
+        """Show only the cards whose name contains the search text."""
+        self.apps_proxy.setFilterFixedString(self._filter_text)
     
     def create_application(self):
         """Create a new application."""
@@ -1409,104 +1780,135 @@ class ApplicationsPage(QWidget):
         
         self.logger.info(f"Action '{action}' requested for application '{app_name}'")
         
-        # Handle actions that require API calls
-        if action in ['start', 'stop', 'restart']:
-            self._execute_application_action(action, app_id, app_name)
-        elif action == 'deploy':
-            self.deploy_application(app_id, app_name)
-        elif action == 'logs':
-            self.view_logs(app_id, app_name)
-        elif action == 'environment':
-            self.manage_environment(app_id, app_name)
-        elif action == 'save_environment':
+        # Saving needs the full payload (env_vars), not just id/name
+        if action == 'save_environment':
             self.save_environment_variables(app_data)
-        elif action == 'delete':
-            self.delete_application(app_id, app_name)
-        elif action == 'refresh_logs':
-            self.refresh_logs(app_id, app_name)
+            return
+        
+        handler = self._action_dispatch.get(action)
+        if handler:
+            handler(app_id, app_name)
+        else:
+            self.logger.warning(f"Unknown application action: {action}")
     
     def _execute_application_action(self, action: str, app_id: str, app_name: str):
         """Execute application action in a separate thread."""
         # Check if an action is already running for this app
-        action_key = f"{action}_{app_id}"
-        if action_key in self.active_actions:
-            QMessageBox.information(
-                self, 
-                "Action in Progress", 
-                f"An action is already running for '{app_name}'. Please wait."
-            )
+        if (action, app_id) in self._in_flight:
+            self._toast.show_info(f"An action is already running for '{app_name}'. Please wait.")
             return
         
         # Confirm destructive actions
-        if action in ['stop', 'restart']:
+        if action in self.CONFIRMED_ACTIONS:
             reply = QMessageBox.question(
                 self,
                 f"Confirm {action.capitalize()}",
                 f"Are you sure you want to {action} application '{app_name}'?",
-                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+                YES_NO_BUTTONS,
                 QMessageBox.StandardButton.No
             )
             
             if reply != QMessageBox.StandardButton.Yes:
                 return
         
-        # Create worker thread
-        thread = QThread()
-        worker = ApplicationActionWorker(self.api_client, action, app_id, app_name)
-        worker.moveToThread(thread)
-        
-        # Connect signals
-        worker.action_completed.connect(self._on_action_completed)
-        worker.progress_updated.connect(self._on_action_progress)
-        thread.started.connect(worker.execute_action)
-        
-        # Store thread info
-        self.active_actions[action_key] = {
-            'thread': thread,
-            'worker': worker,
-            'app_name': app_name,
-            'start_time': QTimer()
-        }
+        self._submit_action(self.action_completed, action, app_id, app_name)
+    
+    def _submit_action(self, completed: Signal, action: str, app_id: str, app_name: str,
+                       env_vars: Optional[Dict[str, str]] = None):
+        """Queue an action on the I/O loop and report its outcome through the completed signal."""
+        future = io_loop.submit(self._perform_action(action, app_id, app_name, env_vars))
+        future.add_done_callback(partial(self._on_action_future_done, completed, action, app_id, app_name))
+        self._in_flight.add((action, app_id))
+        self.logger.debug("Started %s for application %s", action, app_name)
+    
+    async def _perform_action(self, action: str, app_id: str, app_name: str,
+                              env_vars: Optional[Dict[str, str]] = None) -> str:
+        """Run an application action against the API (runs on the I/O loop)."""
+        self.action_progress.emit(f"{action.capitalize()}ing {app_name}...")
+        self.logger.info("Executing %s for application %s (ID: %s)", action, app_name, app_id)
+        api_client = await io_loop.get_client(self.api_client)
+        
+        if action == 'start':
+            response = await api_client.start_application(app_id)
+            message = f"Application '{app_name}' started successfully."
+        elif action == 'stop':
+            response = await api_client.stop_application(app_id)
+            message = f"Application '{app_name}' stopped successfully."
+        elif action == 'restart':
+            response = await api_client.restart_application(app_id)
+            message = f"Application '{app_name}' restarted successfully."
+        elif action == 'save_environment':
+            if env_vars is None:
+                raise ValueError("No environment variables provided for save operation")
+            if self._cached_environment(app_id) == env_vars:
+                return f"Environment variables for '{app_name}' are already up to date."
+            # A single bulk PUT with the full set (the endpoint replaces all variables)
+            await api_client.set_application_env(app_id, env_vars)
+            message = f"Environment variables for '{app_name}' saved successfully."
+        else:
+            raise ValueError(f"Unknown action: {action}")
+        
+        self._update_caches(action, app_id, env_vars)
+        if action in self.ACTION_STATES:
+            # Use the application returned by the API if any, else the state the action leads to
+            if isinstance(response, dict) and response.get('id') == app_id and 'state' in response:
+                self.application_updated.emit(response)
+            else:
+                self.application_updated.emit({'id': app_id, 'state': self.ACTION_STATES[action]})
+        return message
+    
+    def _on_action_future_done(self, completed: Signal, action: str, app_id: str, app_name: str,
+                               future: Future):
+        """Forward a finished action to the GUI thread through the given completion signal."""
+        if future.cancelled():
+            return  # dropped at worker loop shutdown
+        try:
+            message = future.result()
+        except Exception as e:
+            error_msg = f"Failed to {action} application '{app_name}': {str(e)}"
+            self.logger.error(error_msg)
+            completed.emit(ActionResult(action, app_id, app_name, False, error_msg))
+        else:
+            self.logger.info("Action %s completed successfully for %s", action, app_name)
+            completed.emit(ActionResult(action, app_id, app_name, True, message))
+    
+    def _on_application_updated(self, update: Dict[str, Any]):
+        """Patch a single application in place after an action."""
+        result = self.apps_model.update_application(update)
+        if result is None:
+            return
         
-        # Start the thread
-        thread.start()
-        self.logger.info(f"Started {action} thread for application {app_name}")
+        row, app_data = result
+        self.applications[row] = app_data
+        
+        current_app = self.details_panel.current_app
+        if current_app and current_app.get('id') == app_data['id']:
+            self.details_panel.current_app = app_data
+            self.details_panel.update_display()
     
     def _on_action_progress(self, message: str):
         """Handle action progress updates."""
         # Update status in details panel if it's showing this app
-        if hasattr(self, 'details_panel') and self.details_panel.current_app:
+        if self.details_panel.current_app:
             self.details_panel.set_status_message(message)
         
         # Could also show in a status bar if we had one
-        self.logger.debug(f"Action progress: {message}")
+        self.logger.debug("Action progress: %s", message)
     
-    def _on_action_completed(self, action: str, app_name: str, success: bool, message: str):
+    def _on_action_completed(self, result: ActionResult):
         """Handle action completion."""
-        action_key = f"{action}_{app_name}"  # Note: using app_name as approximation
-        
-        # Remove from active actions (find by app_name since we don't have app_id here)
-        to_remove = []
-        for key, info in self.active_actions.items():
-            if info['app_name'] == app_name:
-                to_remove.append(key)
-        
-        for key in to_remove:
-            if key in self.active_actions:
-                thread = self.active_actions[key]['thread']
-                thread.quit()
-                thread.wait()
-                del self.active_actions[key]
+        self._in_flight.discard((result.action, result.app_id))
         
         # Show result to user
-        if success:
-            QMessageBox.information(self, "Success", message)
-            # Refresh applications to show updated state
-            QTimer.singleShot(2000, self.refresh_applications)  # Delay to let API settle
+        if result.success:
+            self._toast.show_success(result.message)
+            # The card already shows the new state; poll at the base rate until it settles
+            self._current_interval = self.REFRESH_INTERVAL
+            self.refresh_timer.setInterval(self._current_interval)
         else:
-            QMessageBox.critical(self, "Error", message)
+            self._toast.show_error(result.message)
         
-        self.logger.info(f"Action {action} completed for {app_name}: {'Success' if success else 'Failed'}")
+        self.logger.info(f"Action {result.action} completed for {result.app_name}: {'Success' if result.success else 'Failed'}")
     
     def start_application(self, app_id: str, app_name: str):
         """Start an application - deprecated, use handle_application_action instead."""
@@ -1554,13 +1956,8 @@ class ApplicationsPage(QWidget):
     def _execute_environment_save(self, app_id: str, app_name: str, env_vars: Dict[str, str]):
         """Execute environment variables save in a separate thread."""
         # Check if an action is already running for this app
-        action_key = f"save_environment_{app_id}"
-        if action_key in self.active_actions:
-            QMessageBox.information(
-                self, 
-                "Save in Progress", 
-                f"Environment variables are already being saved for '{app_name}'. Please wait."
-            )
+        if ('save_environment', app_id) in self._in_flight:
+            self._toast.show_info(f"Environment variables are already being saved for '{app_name}'. Please wait.")
             return
         
         # Confirm save action
@@ -1568,92 +1965,197 @@ class ApplicationsPage(QWidget):
             self,
             "Save Environment Variables",
             f"Save {len(env_vars)} environment variables for '{app_name}'?",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+            YES_NO_BUTTONS,
             QMessageBox.StandardButton.Yes
         )
         
         if reply != QMessageBox.StandardButton.Yes:
             return
         
-        # Create worker thread
-        thread = QThread()
-        worker = ApplicationActionWorker(self.api_client, 'save_environment', app_id, app_name, env_vars)
-        worker.moveToThread(thread)
-        
-        # Connect signals
-        worker.action_completed.connect(self._on_environment_save_completed)
-        worker.progress_updated.connect(self._on_action_progress)
-        thread.started.connect(worker.execute_action)
-        
-        # Store thread info
-        self.active_actions[action_key] = {
-            'thread': thread,
-            'worker': worker,
-            'app_name': app_name,
-            'start_time': QTimer()
-        }
-        
-        # Start the thread
-        thread.start()
-        self.logger.info(f"Started environment save thread for application {app_name}")
+        self._submit_action(self.environment_save_completed, 'save_environment', app_id, app_name, env_vars)
     
-    def _on_environment_save_completed(self, action: str, app_name: str, success: bool, message: str):
+    def _on_environment_save_completed(self, result: ActionResult):
         """Handle environment save completion."""
-        # Remove from active actions
-        action_key = f"save_environment_{app_name}"  # Approximation using app_name
-        to_remove = []
-        for key, info in self.active_actions.items():
-            if 'save_environment' in key and info['app_name'] == app_name:
-                to_remove.append(key)
-        
-        for key in to_remove:
-            if key in self.active_actions:
-                thread = self.active_actions[key]['thread']
-                thread.quit()
-                thread.wait()
-                del self.active_actions[key]
+        self._in_flight.discard((result.action, result.app_id))
         
         # Show result to user
-        if success:
-            QMessageBox.information(self, "Success", message)
-            # Mark as saved in the environment editor
-            if hasattr(self.details_panel, 'env_editor'):
-                self.details_panel.env_editor.mark_saved()
+        if result.success:
+            self._toast.show_success(result.message)
+            # Mark as saved in the environment editor, if it still shows this application
+            env_editor = self.details_panel.env_editor
+            if env_editor is not None and env_editor.current_app_id == result.app_id:
+                env_editor.mark_saved()
         else:
-            QMessageBox.critical(self, "Error", message)
+            self._toast.show_error(result.message)
         
-        self.logger.info(f"Environment save completed for {app_name}: {'Success' if success else 'Failed'}")
+        self.logger.info(f"Environment save completed for {result.app_name}: {'Success' if result.success else 'Failed'}")
     
     def delete_application(self, app_id: str, app_name: str):
         """Delete an application."""
         reply = QMessageBox.question(
             self, "Confirm Delete", 
             f"Are you sure you want to delete application '{app_name}'?\n\nThis action cannot be undone.",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+            YES_NO_BUTTONS
         )
         
         if reply == QMessageBox.StandardButton.Yes:
             QMessageBox.information(self, "Delete", f"Delete functionality for '{app_name}' will be implemented here.")
     
     def refresh_logs(self, app_id: str, app_name: str):
-        """Refresh application logs."""
-        QMessageBox.information(self, "Refresh Logs", f"Refreshing logs for '{app_name}'...")
+        """Fetch new log lines for an application on the I/O loop."""
+        self.logger.info(f"Refreshing logs for application {app_name}")
+        since = self._logs_since[1] if self._logs_since and self._logs_since[0] == app_id else None
+        future = io_loop.submit(self._fetch_logs(app_id, since))
+        future.add_done_callback(partial(self._on_logs_future_done, app_id))
+    
+    async def _fetch_logs(self, app_id: str, since: Optional[str]) -> List[Dict[str, Any]]:
+        """Load application log entries from the API (runs on the I/O loop)."""
+        api_client = await io_loop.get_client(self.api_client)
+        return await api_client.get_application_logs(app_id, since=since, use_cache=False)
+    
+    def _on_logs_future_done(self, app_id: str, future: Future):
+        """Turn fetched log entries into lines and forward them to the GUI thread."""
+        if future.cancelled():
+            return  # dropped at worker loop shutdown
+        try:
+            entries = future.result()
+        except Exception as e:
+            self.logger.error(f"Failed to load logs for {app_id}: {e}")
+            self.logs_loaded.emit(app_id, [f"Failed to load logs: {e}"], '')
+            return
+        
+        lines = []
+        last_timestamp = ''
+        for entry in entries:
+            source = entry.get('_source', entry) if isinstance(entry, dict) else {}
+            timestamp = source.get('@timestamp', '')
+            if timestamp:
+                last_timestamp = timestamp
+            lines.append(f"{timestamp} {source.get('message', entry)}".strip())
+        
+        if lines:
+            self.logs_loaded.emit(app_id, lines, last_timestamp)
+    
+    def _on_logs_loaded(self, app_id: str, lines: List[str], last_timestamp: str):
+        """Show fetched log lines and move the fetch cursor past the ones displayed."""
+        if self.details_panel.append_log_lines(app_id, lines) and last_timestamp:
+            self._logs_since = (app_id, last_timestamp)
+    
+    def _on_logs_cleared(self):
+        """Fetch the full log again once the logs view has been emptied."""
+        self._logs_since = None
+    
+    def load_environment(self, app_id: str, force_refresh: bool = False):
+        """Fetch environment variables for an application on the I/O loop."""
+        future = io_loop.submit(self._fetch_environment(app_id, self.current_org_id, force_refresh))
+        future.add_done_callback(partial(self._on_environment_future_done, app_id))
+    
+    def prefetch_environment(self, app_id: str):
+        """Warm the environment cache for an application once it stays selected or hovered."""
+        self._prefetch_app_id = app_id
+        self._prefetch_timer.start()
+    
+    def _on_application_hovered(self, index: QModelIndex):
+        """Prefetch the variables of the application under the mouse."""
+        app_data = index.data(ApplicationListModel.AppDataRole)
+        if app_data and app_data.get('id'):
+            self.prefetch_environment(app_data['id'])
+    
+    def _run_prefetch(self):
+        """Fetch the pending prefetch on the I/O loop (a cache hit costs no request)."""
+        app_id, self._prefetch_app_id = self._prefetch_app_id, None
+        if not app_id or not self.current_org_id:
+            return
+        future = io_loop.submit(self._fetch_environment(app_id, self.current_org_id))
+        future.add_done_callback(partial(self._on_prefetch_future_done, app_id))
+    
+    def _on_prefetch_future_done(self, app_id: str, future: Future):
+        """Log a failed prefetch; the regular load reports errors to the user."""
+        if future.cancelled():
+            return  # dropped at worker loop shutdown
+        error = future.exception()
+        if error is not None:
+            self.logger.debug("Environment prefetch failed for app %s: %s", app_id, error)
+    
+    def _store_environment(self, key: tuple, env_vars: Dict[str, str]):
+        """Cache variables, evicting the oldest fetch beyond ENV_CACHE_SIZE (runs on the I/O loop)."""
+        self._env_cache.pop(key, None)
+        self._env_cache[key] = (time.monotonic(), env_vars)
+        if len(self._env_cache) > self.ENV_CACHE_SIZE:
+            del self._env_cache[next(iter(self._env_cache))]
+    
+    async def _fetch_environment(self, app_id: str, org_id: Optional[str],
+                                 force_refresh: bool = False) -> Dict[str, str]:
+        """Load environment variables, from cache when fresh (runs on the I/O loop)."""
+        key = (org_id, app_id)
+        task = None
+        if not force_refresh:
+            env_vars = self._cache_get(self._env_cache, key, self.ENV_CACHE_TTL)
+            if env_vars is not None:
+                self.logger.debug("Environment variables for app %s served from cache", app_id)
+                return env_vars
+            # Join a fetch already in flight for this application, e.g. a prefetch
+            task = self._env_requests.get(key)
+        
+        if task is None:
+            task = asyncio.create_task(self._request_environment(key))
+            self._env_requests[key] = task
+        return await task
+    
+    async def _request_environment(self, key: tuple) -> Dict[str, str]:
+        """Load environment variables from the API and cache them (runs on the I/O loop)."""
+        org_id, app_id = key
+        try:
+            self.logger.info("Loading environment variables for app: %s with org_id: %s", app_id, org_id)
+            api_client = await io_loop.get_client(self.api_client)
+            env_data = await api_client.get_application_env(app_id, org_id, use_cache=False)
+        finally:
+            if self._env_requests.get(key) is asyncio.current_task():
+                del self._env_requests[key]
+        
+        # Convert API format to simple dict: the API returns [{"name": "...", "value": "..."}]
+        # directly, wrapped as {"env": [...], ...}, or as a simple dict
+        raw = env_data.get('env', env_data) if isinstance(env_data, dict) else env_data
+        if isinstance(raw, list):
+            env_vars = {
+                var['name']: var['value']
+                for var in raw
+                if var.__class__ is dict and 'name' in var and 'value' in var
+            }
+        else:
+            env_vars = raw if isinstance(raw, dict) else {}
+        
+        self._store_environment(key, env_vars)
+        self.logger.info("Loaded %d environment variables", len(env_vars))
+        return env_vars
+    
+    def _on_environment_future_done(self, app_id: str, future: Future):
+        """Forward a finished environment fetch to the GUI thread."""
+        if future.cancelled():
+            return  # dropped at worker loop shutdown
+        try:
+            env_vars = future.result()
+        except Exception as e:
+            self.logger.error(f"Failed to load environment variables: {e}")
+            self.environment_error.emit(app_id, str(e))
+        else:
+            self.environment_loaded.emit(app_id, env_vars)
     
     def showEvent(self, event):
         """Handle page show event."""
         super().showEvent(event)
-        # Refresh applications when page is shown
-        self.refresh_applications()
+        # Refresh applications when page is shown, unless the data is still fresh
+        if time.monotonic() - self._last_load > self.SHOW_REFRESH_TTL:
+            self.refresh_applications()
+        self.refresh_timer.start(self._current_interval)
+    
+    def hideEvent(self, event):
+        """Handle page hide event - stop polling while not visible."""
+        self.refresh_timer.stop()
+        super().hideEvent(event)
     
     def closeEvent(self, event):
         """Handle page close event - cleanup active actions."""
-        # Cancel all running actions
-        for action_key, info in self.active_actions.items():
-            thread = info['thread']
-            if thread.isRunning():
-                self.logger.info(f"Terminating action thread: {action_key}")
-                thread.quit()
-                thread.wait(3000)  # Wait up to 3 seconds
-        
-        self.active_actions.clear()
-        super().closeEvent(event) 
\ No newline at end of file
+        # Running actions keep going on the I/O loop until the application quits
+        self._in_flight.clear()
+        super().closeEvent(event)
@@ -5,6 +5,7 @@ Central dashboard interface with sidebar navigation and content management.
 """
 
 import logging
+from functools import partial
 from typing import Optional, Dict, Any
 
 from PySide6.QtWidgets import (
@@ -12,28 +13,91 @@ from PySide6.QtWidgets import (
     QLabel, QPushButton, QFrame, QScrollArea, QComboBox, QSpacerItem,
     QSizePolicy, QToolButton, QButtonGroup
 )
-from PySide6.QtCore import Qt, Signal, QSize, QTimer
-from PySide6.QtGui import QFont, QIcon, QPalette
+from PySide6.QtCore import Qt, Signal, QSize, QTimer, QSignalBlocker
+from PySide6.QtGui import QFont, QIcon, QPalette, QStandardItemModel, QStandardItem
 
 from ..api.client import CleverCloudClient
 
 
+# Sidebar title font, shared by every sidebar (QFont is implicitly shared)
+TITLE_FONT = QFont()
+TITLE_FONT.setPointSize(14)  # Slightly smaller
+TITLE_FONT.setBold(True)
+
+
 class NavigationSidebar(QWidget):
     """Sidebar navigation with page selection."""
     
     page_requested = Signal(str)  # page_name
     
+    # Navigation items: (page_id, label); settings sits apart at the bottom
+    NAV_ITEMS = (
+        ("dashboard", "📊 Dashboard"),
+        ("applications", "🚀 Applications"),
+        ("addons", "🗃️ Add-ons"),
+        ("network", "🌐 Network Groups"),
+        ("logs", "📋 Logs"),
+        ("billing", "💰 Billing"),
+    )
+    DEFAULT_PAGE = "dashboard"
+    
+    # Installed once by MainDashboard rather than parsed per instance
+    STYLE = """
+        NavigationSidebar {
+            background-color: #f8f9fa;
+            border-right: 1px solid #e9ecef;
+        }
+        
+        #sidebarHeader {
+            background-color: #007ACC;
+            border: none;
+        }
+        
+        #sidebarTitle {
+            color: white;
+            font-weight: bold;
+        }
+        
+        #navButton {
+            text-align: left;
+            padding: 12px 20px;
+            border: none;
+            border-radius: 8px;
+            background-color: transparent;
+            color: #495057;
+            font-size: 15px;
+            font-weight: 500;
+        }
+        
+        #navButton:hover {
+            background-color: #e9ecef;
+            color: #212529;
+        }
+        
+        #navButton:checked {
+            background-color: #007ACC;
+            color: white;
+            font-weight: 600;
+        }
+    """
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.logger = logging.getLogger(__name__)
-        self.button_group = QButtonGroup(self)
+        self.button_group: Optional[QButtonGroup] = None
         
         self.setFixedWidth(280)  # Increased width
-        self.setup_ui()
-        self.setup_styles()
+    
+    def showEvent(self, event):
+        """Build the sidebar the first time it is shown."""
+        if self.button_group is None:
+            self.setup_ui()
+        super().showEvent(event)
     
     def setup_ui(self):
         """Setup the sidebar UI."""
+        self.button_group = QButtonGroup(self)
+        
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(0)
@@ -46,10 +110,7 @@ class NavigationSidebar(QWidget):
         
         # Logo/Title
         title_label = QLabel("🚀 Clever Cloud")
-        title_font = QFont()
-        title_font.setPointSize(14)  # Slightly smaller
-        title_font.setBold(True)
-        title_label.setFont(title_font)
+        title_label.setFont(TITLE_FONT)
         title_label.setObjectName("sidebarTitle")
         header_layout.addWidget(title_label)
         
@@ -62,18 +123,9 @@ class NavigationSidebar(QWidget):
         nav_layout.setSpacing(8)  # Increased spacing
         
         # Navigation items
-        nav_items = [
-            ("dashboard", "📊 Dashboard", True),
-            ("applications", "🚀 Applications", False),
-            ("addons", "🗃️ Add-ons", False),
-            ("network", "🌐 Network Groups", False),
-            ("logs", "📋 Logs", False),
-            ("billing", "💰 Billing", False),
-        ]
-        
-        for page_id, label, is_default in nav_items:
+        for page_id, label in self.NAV_ITEMS:
             btn = self.create_nav_button(page_id, label)
-            if is_default:
+            if page_id == self.DEFAULT_PAGE:
                 btn.setChecked(True)
             nav_layout.addWidget(btn)
         
@@ -92,59 +144,55 @@ class NavigationSidebar(QWidget):
         btn.setObjectName("navButton")
         btn.setCheckable(True)
         btn.setMinimumHeight(40)
-        btn.clicked.connect(lambda: self.page_requested.emit(page_id))
+        btn.clicked.connect(partial(self.page_requested.emit, page_id))
         
         self.button_group.addButton(btn)
         return btn
+
+
+class DashboardHeader(QWidget):
+    """Dashboard header with user info and organization selector."""
     
-    def setup_styles(self):
-        """Setup sidebar styles."""
-        self.setStyleSheet("""
-        NavigationSidebar {
-            background-color: #f8f9fa;
-            border-right: 1px solid #e9ecef;
-        }
-        
-        #sidebarHeader {
-            background-color: #007ACC;
-            border: none;
-        }
-        
-        #sidebarTitle {
-            color: white;
-            font-weight: bold;
+    logout_requested = Signal()
+    organization_changed = Signal(str)  # org_id
+    refresh_requested = Signal()
+    
+    # Installed once by MainDashboard rather than parsed per instance
+    STYLE = """
+        DashboardHeader {
+            background-color: white;
+            border-bottom: 1px solid #e9ecef;
+            max-height: 40px;
         }
         
-        #navButton {
-            text-align: left;
-            padding: 12px 20px;
-            border: none;
-            border-radius: 8px;
-            background-color: transparent;
+        DashboardHeader QLabel {
             color: #495057;
-            font-size: 15px;
-            font-weight: 500;
+            font-size: 12px;
         }
         
-        #navButton:hover {
-            background-color: #e9ecef;
-            color: #212529;
+        DashboardHeader QPushButton {
+            padding: 4px 8px;
+            border: 1px solid #007ACC;
+            border-radius: 4px;
+            background-color: white;
+            color: #007ACC;
+            font-size: 12px;
+            font-weight: 500;
         }
         
-        #navButton:checked {
+        DashboardHeader QPushButton:hover {
             background-color: #007ACC;
             color: white;
-            font-weight: 600;
         }
-        """)
-
-
-class DashboardHeader(QWidget):
-    """Dashboard header with user info and organization selector."""
-    
-    logout_requested = Signal()
-    organization_changed = Signal(str)  # org_id
-    refresh_requested = Signal()
+        
+        DashboardHeader QComboBox {
+            padding: 4px 8px;
+            border: 1px solid #ced4da;
+            border-radius: 4px;
+            background-color: white;
+            font-size: 12px;
+        }
+    """
     
     def __init__(self, api_client: CleverCloudClient, parent=None):
         super().__init__(parent)
@@ -154,8 +202,13 @@ class DashboardHeader(QWidget):
         self.organizations = []
         self.current_org_id = None
         
+        # Repopulating the combo fires several changes in a row; only report the last one
+        self._org_change_timer = QTimer(self)
+        self._org_change_timer.setSingleShot(True)
+        self._org_change_timer.setInterval(150)
+        self._org_change_timer.timeout.connect(self._emit_organization_changed)
+        
         self.setup_ui()
-        self.setup_styles()
         
         # Show loading state initially
         self.org_combo.addItem("🔄 Loading organizations...")
@@ -174,7 +227,7 @@ class DashboardHeader(QWidget):
         self.org_combo = QComboBox()
         self.org_combo.setMinimumWidth(150)  # Much smaller
         self.org_combo.setMaximumWidth(180)
-        self.org_combo.currentTextChanged.connect(self._on_org_changed)
+        self.org_combo.currentIndexChanged.connect(self._on_org_changed)
         layout.addWidget(self.org_combo)
         
         # Spacer
@@ -210,68 +263,38 @@ class DashboardHeader(QWidget):
     def set_organizations(self, organizations: list):
         """Set available organizations."""
         self.organizations = organizations
-        self.org_combo.clear()
         self.org_combo.setEnabled(True)  # Enable the combo box
         
         self.logger.info(f"DashboardHeader: Setting {len(organizations)} organizations")
         
+        # Build the items off-screen so the combo is relaid out once, not per organization
+        model = QStandardItemModel(self.org_combo)
         for org in organizations:
-            org_name = org.get('name', 'Unknown Organization')
-            org_id = org.get('id', '')
-            self.org_combo.addItem(org_name, org_id)
-            self.logger.info(f"DashboardHeader: Added organization: {org_name} ({org_id})")
+            item = QStandardItem(org.get('name', 'Unknown Organization'))
+            item.setData(org.get('id', ''), Qt.ItemDataRole.UserRole)
+            model.appendRow(item)
+        
+        # Repopulate silently; only the resulting selection is reported
+        with QSignalBlocker(self.org_combo):
+            self.org_combo.setModel(model)  # the previous combo-owned model is deleted
+            
+            # Keep the current organization selected, otherwise select the first one
+            index = self.org_combo.findData(self.current_org_id) if self.current_org_id else -1
+            self.org_combo.setCurrentIndex(max(index, 0))
         
         self.logger.info(f"DashboardHeader: Organization combo now has {self.org_combo.count()} items")
-        
-        # If no current organization is set and we have organizations, select the first one
-        if not self.current_org_id and organizations:
-            self.current_org_id = organizations[0].get('id')
-            self.org_combo.setCurrentIndex(0)
-            self.logger.info(f"DashboardHeader: Auto-selected first organization: {self.current_org_id}")
+        self._on_org_changed(self.org_combo.currentIndex())
     
-    def _on_org_changed(self, org_name: str):
+    def _on_org_changed(self, index: int):
         """Handle organization change."""
+        self._org_change_timer.start()
+    
+    def _emit_organization_changed(self):
+        """Report the organization selected once the combo has settled."""
         org_id = self.org_combo.currentData()
-        if org_id:
+        if org_id and org_id != self.current_org_id:
+            self.current_org_id = org_id
             self.organization_changed.emit(org_id)
-    
-    def setup_styles(self):
-        """Setup header styles."""
-        self.setStyleSheet("""
-        DashboardHeader {
-            background-color: white;
-            border-bottom: 1px solid #e9ecef;
-            max-height: 40px;
-        }
-        
-        QLabel {
-            color: #495057;
-            font-size: 12px;
-        }
-        
-        QPushButton {
-            padding: 4px 8px;
-            border: 1px solid #007ACC;
-            border-radius: 4px;
-            background-color: white;
-            color: #007ACC;
-            font-size: 12px;
-            font-weight: 500;
-        }
-        
-        QPushButton:hover {
-            background-color: #007ACC;
-            color: white;
-        }
-        
-        QComboBox {
-            padding: 4px 8px;
-            border: 1px solid #ced4da;
-            border-radius: 4px;
-            background-color: white;
-            font-size: 12px;
-        }
-        """)
 
 
 class MainDashboard(QWidget):
@@ -282,6 +305,10 @@ class MainDashboard(QWidget):
     organization_changed = Signal(str)
     refresh_requested = Signal()
     
+    # Pages reachable from the sidebar
+    PAGE_NAMES = ("dashboard", "applications", "addons", "network", "logs", "billing", "settings")
+    PLACEHOLDER_PAGES = ("logs", "billing", "settings")  # sections sharing the "Coming Soon" page
+    
     def __init__(self, api_client: CleverCloudClient, parent=None):
         super().__init__(parent)
         self.api_client = api_client
@@ -294,6 +321,9 @@ class MainDashboard(QWidget):
     
     def setup_ui(self):
         """Setup the dashboard UI."""
+        # One stylesheet for the header and sidebar, parsed once per dashboard
+        self.setStyleSheet(NavigationSidebar.STYLE + DashboardHeader.STYLE)
+        
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(0)
@@ -327,43 +357,51 @@ class MainDashboard(QWidget):
         self._setup_pages()
     
     def _setup_pages(self):
-        """Setup content pages."""
-        from .applications_page import ApplicationsPage
-        from .dashboard_page import DashboardPage
-        from .addons_page import AddonsPage
-        from .network_groups_page import NetworkGroupsPage
-        
-        # Dashboard page
-        self.dashboard_page = DashboardPage(self.api_client)
-        self.content_area.addWidget(self.dashboard_page)
-        
-        # Applications page
-        self.applications_page = ApplicationsPage(self.api_client)
-        self.content_area.addWidget(self.applications_page)
-        
-        # Add-ons page
-        self.addons_page = AddonsPage(self.api_client)
-        self.content_area.addWidget(self.addons_page)
-        
-        # Network Groups page
-        self.network_groups_page = NetworkGroupsPage(self.api_client)
-        self.content_area.addWidget(self.network_groups_page)
-        
-        # Placeholder pages for other sections
-        for page_name in ["logs", "billing", "settings"]:
-            placeholder = self._create_placeholder_page(page_name.title())
-            self.content_area.addWidget(placeholder)
+        """Setup content pages (each page is built on first navigation)."""
+        self._pages: Dict[str, QWidget] = {}
+        self.current_org_id: Optional[str] = None
         
         # Show dashboard by default
-        self.content_area.setCurrentWidget(self.dashboard_page)
+        self._on_page_requested("dashboard")
+    
+    def _create_page(self, page_name: str) -> QWidget:
+        """Create a content page, importing its module only when first needed."""
+        if page_name == "dashboard":
+            from .dashboard_page import DashboardPage
+            return DashboardPage(self.api_client)
+        if page_name == "applications":
+            from .applications_page import ApplicationsPage
+            return ApplicationsPage(self.api_client)
+        if page_name == "addons":
+            from .addons_page import AddonsPage
+            return AddonsPage(self.api_client)
+        if page_name == "network":
+            from .network_groups_page import NetworkGroupsPage
+            return NetworkGroupsPage(self.api_client)
+        
+        # One placeholder page serves the sections not implemented yet
+        return self._create_placeholder_page()
     
-    def _create_placeholder_page(self, title: str) -> QWidget:
-        """Create a placeholder page."""
+    def _get_page(self, page_name: str) -> QWidget:
+        """Return the page for page_name, creating it on first use."""
+        page = self._pages.get(page_name)
+        if page is None:
+            page = self._create_page(page_name)
+            self._pages[page_name] = page
+            self.content_area.addWidget(page)
+            
+            # Pages created after an organization switch start on that organization
+            if self.current_org_id and hasattr(page, 'set_organization'):
+                page.set_organization(self.current_org_id)
+        return page
+    
+    def _create_placeholder_page(self) -> QWidget:
+        """Create the placeholder page; its title is set on navigation."""
         page = QWidget()
         layout = QVBoxLayout(page)
         layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
-        label = QLabel(f"🚧 {title} Page\nComing Soon!")
+        label = QLabel()
         label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         label.setStyleSheet("""
             QLabel {
@@ -373,49 +411,43 @@ class MainDashboard(QWidget):
             }
         """)
         layout.addWidget(label)
+        self._placeholder_label = label
         
         return page
     
     def _on_page_requested(self, page_name: str):
         """Handle page navigation."""
-        page_mapping = {
-            "dashboard": 0,
-            "applications": 1,
-            "addons": 2,
-            "network": 3,
-            "logs": 4,
-            "billing": 5,
-            "settings": 6,
-        }
+        if page_name not in self.PAGE_NAMES:
+            page_name = "dashboard"
         
-        page_index = page_mapping.get(page_name, 0)
-        self.content_area.setCurrentIndex(page_index)
+        if page_name in self.PLACEHOLDER_PAGES:
+            page = self._get_page("placeholder")
+            self._placeholder_label.setText(f"🚧 {page_name.title()} Page\nComing Soon!")
+        else:
+            page = self._get_page(page_name)
+        self.content_area.setCurrentWidget(page)
         
         self.logger.info(f"Navigated to page: {page_name}")
     
     def _on_organization_changed(self, org_id: str):
         """Handle organization change and update all pages."""
+        if org_id == self.current_org_id:
+            return
+        
         self.logger.info(f"Organization changed to: {org_id}")
+        self.current_org_id = org_id
         
         # Show loading indicator
         if hasattr(self, 'status_bar'):
             self.status_bar.showMessage(f"Switching to organization... Please wait.")
         
-        # Update all pages with new organization - check if they exist and have the method
+        # Update the pages created so far; the others pick up the organization when first shown
         # Use QTimer to stagger the updates and avoid overwhelming the system
-        update_queue = []
-        
-        if hasattr(self, 'dashboard_page') and hasattr(self.dashboard_page, 'set_organization'):
-            update_queue.append(('dashboard_page', self.dashboard_page))
-        
-        if hasattr(self, 'applications_page') and hasattr(self.applications_page, 'set_organization'):
-            update_queue.append(('applications_page', self.applications_page))
-        
-        if hasattr(self, 'addons_page') and hasattr(self.addons_page, 'set_organization'):
-            update_queue.append(('addons_page', self.addons_page))
-        
-        if hasattr(self, 'network_groups_page') and hasattr(self.network_groups_page, 'set_organization'):
-            update_queue.append(('network_groups_page', self.network_groups_page))
+        update_queue = [
+            (f"{page_name} page", page)
+            for page_name, page in self._pages.items()
+            if hasattr(page, 'set_organization')
+        ]
         
         # Process updates with small delays to avoid thread conflicts
         self._process_organization_updates(update_queue, org_id, 0)
@@ -456,12 +488,13 @@ class MainDashboard(QWidget):
         """Refresh dashboard data."""
         self.logger.info("Refreshing dashboard data...")
         # Data refresh will be handled by ApplicationManager
-        # Just refresh the current pages
-        if hasattr(self, 'dashboard_page'):
-            self.dashboard_page.refresh_stats()
-        if hasattr(self, 'applications_page'):
-            self.applications_page.refresh_applications()
-        if hasattr(self, 'addons_page'):
-            self.addons_page.refresh_addons()
-        if hasattr(self, 'network_groups_page'):
-            self.network_groups_page.refresh_network_groups() 
\ No newline at end of file
+        # Just refresh the pages that have been created
+        pages = self._pages
+        if "dashboard" in pages:
+            pages["dashboard"].refresh_stats()
+        if "applications" in pages:
+            pages["applications"].refresh_applications()
+        if "addons" in pages:
+            pages["addons"].refresh_addons()
+        if "network" in pages:
+            pages["network"].refresh_network_groups()
@@ -4,21 +4,161 @@ Dashboard Overview Page
 Main dashboard page showing overview statistics and quick actions.
 """
 
+import asyncio
 import logging
-from typing import Dict, Any, List
+import time
+from concurrent.futures import Future
+from functools import partial
+from typing import Dict, Any, List, Optional, Tuple
 
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, QLabel, QPushButton,
-    QFrame, QScrollArea, QProgressBar, QGroupBox, QListWidget, QListWidgetItem
+    QApplication, QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, QLabel, QPushButton,
+    QFrame, QScrollArea, QProgressBar, QGroupBox, QListView, QStyle, QStyledItemDelegate
 )
-from PySide6.QtCore import Qt, Signal, QTimer
-from PySide6.QtGui import QFont, QPalette
+from PySide6.QtCore import Qt, Signal, QTimer, QAbstractListModel, QModelIndex, QRect, QSize
+from PySide6.QtGui import QFont, QFontMetrics, QPalette, QColor, QPainter, QPixmap
 
 from ..api.client import CleverCloudClient
+from ..api.io_loop import io_loop
 
 
-class StatCard(QFrame):
-    """Statistics card widget."""
+def _font(pixel_size: int, bold: bool = False, weight: Optional[QFont.Weight] = None) -> QFont:
+    font = QFont()
+    font.setPixelSize(pixel_size)
+    font.setBold(bold)
+    if weight is not None:
+        font.setWeight(weight)
+    return font
+
+
+# Fonts of the static labels, shared by every instance (QFont is implicitly shared)
+PAGE_TITLE_FONT = _font(20, bold=True)
+PAGE_SUBTITLE_FONT = _font(13)
+SECTION_TITLE_FONT = _font(16, bold=True)
+STAT_ICON_FONT = _font(24)
+STAT_TITLE_FONT = _font(14, weight=QFont.Weight.DemiBold)
+STAT_VALUE_FONT = _font(32, bold=True)
+ACTION_ICON_FONT = _font(20)
+ACTIVITY_ICON_FONT = _font(16)
+
+# Colors used by the painted cards and rows, parsed once instead of on every paint
+TEXT_COLOR = QColor("#212529")
+MUTED_TEXT_COLOR = QColor("#6c757d")
+BORDER_COLOR = QColor("#e9ecef")
+HOVER_COLOR = QColor("#f8f9fa")
+CARD_COLOR = QColor("white")
+
+# Emoji icons go through the complex text shaper, so each one is drawn once per
+# font into a pixmap that is blitted on every paint afterwards
+_ICON_CACHE: Dict[Tuple[str, str], QPixmap] = {}
+
+
+def icon_pixmap(icon: str, font: QFont) -> QPixmap:
+    """Return the icon drawn with the font, rendering it on first use."""
+    key = (icon, font.key())
+    pixmap = _ICON_CACHE.get(key)
+    if pixmap is None:
+        metrics = QFontMetrics(font)
+        width, height = metrics.horizontalAdvance(icon), metrics.height()
+        ratio = QApplication.instance().devicePixelRatio()
+        pixmap = QPixmap(round(width * ratio), round(height * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
+        painter.setPen(TEXT_COLOR)
+        painter.setFont(font)
+        painter.drawText(QRect(0, 0, width, height), Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, icon)
+        painter.end()
+        _ICON_CACHE[key] = pixmap
+    return pixmap
+
+
+# Styles of the dashboard labels, action cards and activity list, installed once on DashboardPage
+DASHBOARD_STYLE = """
+    #pageTitle {
+        color: #212529;
+    }
+    
+    #pageSubtitle {
+        color: #6c757d;
+        margin-left: 15px;
+    }
+    
+    #sectionTitle {
+        color: #212529;
+        margin-bottom: 8px;
+    }
+    
+    QuickActionCard {
+        background-color: white;
+        border: 1px solid #e9ecef;
+        border-radius: 8px;
+        min-height: 60px;
+    }
+    
+    QuickActionCard:hover {
+        border-color: #007ACC;
+        background-color: #f8f9fa;
+    }
+    
+    #actionTitle {
+        color: #212529;
+        font-size: 14px;
+        font-weight: bold;
+    }
+    
+    #actionDescription {
+        color: #6c757d;
+        font-size: 12px;
+        line-height: 1.3;
+    }
+    
+    #actionButton {
+        background-color: #007ACC;
+        color: white;
+        border: none;
+        border-radius: 4px;
+        font-size: 12px;
+        font-weight: bold;
+    }
+    
+    #actionButton:hover {
+        background-color: #005a9e;
+    }
+    
+    RecentActivityWidget {
+        font-size: 16px;
+        font-weight: bold;
+        color: #212529;
+        border: 1px solid #e9ecef;
+        border-radius: 8px;
+        margin-top: 10px;
+        padding-top: 10px;
+    }
+    
+    RecentActivityWidget::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 10px 0 10px;
+        background-color: white;
+    }
+    
+    RecentActivityWidget QListView {
+        border: none;
+        background-color: transparent;
+    }
+"""
+
+
+class StatCard(QWidget):
+    """Statistics card widget, painted in one pass without child widgets."""
+    
+    PADDING_X = 20
+    PADDING_Y = 16
+    SPACING = 10       # between the title row and the value
+    ICON_SPACING = 10  # between the icon and the title
+    BORDER = 2
+    ACCENT_WIDTH = 5   # accent bar on the left, in place of the border
     
     def __init__(self, title: str, value: str, icon: str = "", color: str = "#007ACC", parent=None):
         super().__init__(parent)
@@ -26,69 +166,89 @@ class StatCard(QFrame):
         self.value = value
         self.icon = icon
         self.color = color
+        self._accent = QColor(color)
+        self._hover = False
         
-        self.setup_ui()
-        self.setup_styles()
+        self._icon_metrics = QFontMetrics(STAT_ICON_FONT)
+        self._title_metrics = QFontMetrics(STAT_TITLE_FONT)
+        self._value_metrics = QFontMetrics(STAT_VALUE_FONT)
+        
+        self.setMinimumHeight(100)
     
-    def setup_ui(self):
-        """Setup the card UI."""
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(20, 16, 20, 16)  # More generous padding
-        layout.setSpacing(10)
+    def update_value(self, new_value: str):
+        """Update the card value."""
+        if new_value == self.value:
+            return  # unchanged counts leave the card untouched
+        self.value = new_value
+        self.update()
+    
+    def _row_height(self) -> int:
+        """Height of the icon and title row."""
+        height = self._title_metrics.height()
+        if self.icon:
+            height = max(height, self._icon_metrics.height())
+        return height
+    
+    def sizeHint(self) -> QSize:
+        width = self._title_metrics.horizontalAdvance(self.title)
+        if self.icon:
+            width += self._icon_metrics.horizontalAdvance(self.icon) + self.ICON_SPACING
+        height = self._row_height() + self.SPACING + self._value_metrics.height()
+        return QSize(
+            width + 2 * self.PADDING_X + self.ACCENT_WIDTH + self.BORDER,
+            height + 2 * (self.PADDING_Y + self.BORDER)
+        )
+    
+    def enterEvent(self, event):
+        self._hover = True
+        self.update()
+        super().enterEvent(event)
+    
+    def leaveEvent(self, event):
+        self._hover = False
+        self.update()
+        super().leaveEvent(event)
+    
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+        rect = self.rect()
+        accent = self._accent
+        
+        # Border (accent on hover), then the accent bar on the left, then the background
+        painter.setBrush(accent if self._hover else BORDER_COLOR)
+        painter.drawRoundedRect(rect, 10, 10)
+        painter.save()
+        painter.setClipRect(QRect(rect.left(), rect.top(), self.ACCENT_WIDTH, rect.height()))
+        painter.setBrush(accent)
+        painter.drawRoundedRect(rect, 10, 10)
+        painter.restore()
+        painter.setBrush(HOVER_COLOR if self._hover else CARD_COLOR)
+        inner = rect.adjusted(self.ACCENT_WIDTH, self.BORDER, -self.BORDER, -self.BORDER)
+        painter.drawRoundedRect(inner, 8, 8)
+        
+        content = inner.adjusted(self.PADDING_X, self.PADDING_Y, -self.PADDING_X, -self.PADDING_Y)
+        left = Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+        row = QRect(content.left(), content.top(), content.width(), self._row_height())
         
         # Icon and title row
-        header_layout = QHBoxLayout()
-        
         if self.icon:
-            icon_label = QLabel(self.icon)
-            icon_label.setStyleSheet("font-size: 24px;")
-            header_layout.addWidget(icon_label)
-        
-        title_label = QLabel(self.title)
-        title_label.setObjectName("cardTitle")
-        header_layout.addWidget(title_label)
-        header_layout.addStretch()
-        
-        layout.addLayout(header_layout)
+            icon_top = row.top() + (row.height() - self._icon_metrics.height()) // 2
+            painter.drawPixmap(row.left(), icon_top, icon_pixmap(self.icon, STAT_ICON_FONT))
+            row.setLeft(row.left() + self._icon_metrics.horizontalAdvance(self.icon) + self.ICON_SPACING)
+        painter.setPen(MUTED_TEXT_COLOR)
+        painter.setFont(STAT_TITLE_FONT)
+        painter.drawText(row, left, self.title)
         
         # Value
-        self.value_label = QLabel(self.value)
-        self.value_label.setObjectName("cardValue")
-        layout.addWidget(self.value_label)
-    
-    def update_value(self, new_value: str):
-        """Update the card value."""
-        self.value = new_value
-        self.value_label.setText(new_value)
-    
-    def setup_styles(self):
-        """Setup card styles."""
-        self.setStyleSheet(f"""
-        StatCard {{
-            background-color: white;
-            border: 2px solid #e9ecef;
-            border-radius: 10px;
-            border-left: 5px solid {self.color};
-            min-height: 100px;
-        }}
-        
-        StatCard:hover {{
-            border-color: {self.color};
-            background-color: #f8f9fa;
-        }}
-        
-        #cardTitle {{
-            color: #6c757d;
-            font-size: 14px;
-            font-weight: 600;
-        }}
-        
-        #cardValue {{
-            color: #212529;
-            font-size: 32px;
-            font-weight: bold;
-        }}
-        """)
+        painter.setPen(TEXT_COLOR)
+        painter.setFont(STAT_VALUE_FONT)
+        value_top = row.bottom() + 1 + self.SPACING
+        painter.drawText(
+            QRect(content.left(), value_top, content.width(), self._value_metrics.height()),
+            left, self.value
+        )
 
 
 class QuickActionCard(QFrame):
@@ -104,7 +264,6 @@ class QuickActionCard(QFrame):
         self.icon = icon
         
         self.setup_ui()
-        self.setup_styles()
     
     def setup_ui(self):
         """Setup the card UI."""
@@ -114,8 +273,8 @@ class QuickActionCard(QFrame):
         
         # Icon
         if self.icon:
-            icon_label = QLabel(self.icon)
-            icon_label.setStyleSheet("font-size: 20px;")
+            icon_label = QLabel()
+            icon_label.setPixmap(icon_pixmap(self.icon, ACTION_ICON_FONT))
             icon_label.setFixedSize(32, 32)
             icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
             layout.addWidget(icon_label)
@@ -141,49 +300,103 @@ class QuickActionCard(QFrame):
         self.action_btn = QPushButton("Start")
         self.action_btn.setObjectName("actionButton")
         self.action_btn.setFixedSize(60, 32)
-        self.action_btn.clicked.connect(lambda: self.action_clicked.emit(self.action_id))
+        self.action_btn.clicked.connect(self._on_clicked)
         layout.addWidget(self.action_btn)
     
-    def setup_styles(self):
-        """Setup card styles."""
-        self.setStyleSheet("""
-        QuickActionCard {
-            background-color: white;
-            border: 1px solid #e9ecef;
-            border-radius: 8px;
-            min-height: 60px;
-        }
-        
-        QuickActionCard:hover {
-            border-color: #007ACC;
-            background-color: #f8f9fa;
-        }
-        
-        #actionTitle {
-            color: #212529;
-            font-size: 14px;
-            font-weight: bold;
-        }
+    def _on_clicked(self):
+        """Forward a click on the action button with this card's action id."""
+        self.action_clicked.emit(self.action_id)
+
+
+class ActivityListModel(QAbstractListModel):
+    """List model of recent activities, one (icon, message, time) per row."""
+    
+    ActivityRole = Qt.ItemDataRole.UserRole  # (icon, message, time)
+    MAX_ACTIVITIES = 20  # the oldest activities are dropped beyond this
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._activities: List[Tuple[str, str, str]] = []
+    
+    def append_activity(self, icon: str, message: str, time_text: str):
+        """Add an activity at the end of the list, dropping the oldest one when full."""
+        if len(self._activities) >= self.MAX_ACTIVITIES:
+            self.beginRemoveRows(QModelIndex(), 0, 0)
+            del self._activities[0]
+            self.endRemoveRows()
+        
+        row = len(self._activities)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._activities.append((icon, message, time_text))
+        self.endInsertRows()
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._activities)
+    
+    def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        activity = self._activities[index.row()]
+        if role == self.ActivityRole:
+            return activity
+        if role == Qt.ItemDataRole.DisplayRole:
+            return activity[1]
+        return None
+
+
+class ActivityDelegate(QStyledItemDelegate):
+    """Paints an activity row: icon, message and time."""
+    
+    ROW_HEIGHT = 34
+    PADDING = 10      # left/right of the row
+    ICON_WIDTH = 30   # icon column, including its gap to the message
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._icon_height = QFontMetrics(ACTIVITY_ICON_FONT).height()
+        self._message_font = _font(14)
+        self._time_font = _font(12)
+        self._message_metrics = QFontMetrics(self._message_font)
+        self._time_metrics = QFontMetrics(self._time_font)
+    
+    def paint(self, painter, option, index):
+        icon, message, time_text = index.data(ActivityListModel.ActivityRole)
+        rect = option.rect
+        content = rect.adjusted(self.PADDING, 0, -self.PADDING, 0)
+        left = Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
         
-        #actionDescription {
-            color: #6c757d;
-            font-size: 12px;
-            line-height: 1.3;
-        }
+        painter.save()
         
-        #actionButton {
-            background-color: #007ACC;
-            color: white;
-            border: none;
-            border-radius: 4px;
-            font-size: 12px;
-            font-weight: bold;
-        }
+        # Hover background and row separator
+        if option.state & QStyle.StateFlag.State_MouseOver:
+            painter.fillRect(rect, HOVER_COLOR)
+        painter.setPen(HOVER_COLOR)
+        painter.drawLine(rect.bottomLeft(), rect.bottomRight())
         
-        #actionButton:hover {
-            background-color: #005a9e;
-        }
-        """)
+        # Icon
+        icon_top = content.top() + (content.height() - self._icon_height) // 2
+        painter.drawPixmap(content.left(), icon_top, icon_pixmap(icon, ACTIVITY_ICON_FONT))
+        
+        # Time, right aligned
+        time_width = self._time_metrics.horizontalAdvance(time_text)
+        painter.setPen(MUTED_TEXT_COLOR)
+        painter.setFont(self._time_font)
+        painter.drawText(content, Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter, time_text)
+        
+        # Message, elided to the space left between icon and time
+        message_width = content.width() - self.ICON_WIDTH - time_width - self.PADDING
+        painter.setPen(TEXT_COLOR)
+        painter.setFont(self._message_font)
+        painter.drawText(
+            QRect(content.left() + self.ICON_WIDTH, content.top(), message_width, content.height()), left,
+            self._message_metrics.elidedText(message, Qt.TextElideMode.ElideRight, message_width)
+        )
+        
+        painter.restore()
+    
+    def sizeHint(self, option, index) -> QSize:
+        return QSize(0, self.ROW_HEIGHT)  # rows span the view width, messages are elided
 
 
 class RecentActivityWidget(QGroupBox):
@@ -192,13 +405,20 @@ class RecentActivityWidget(QGroupBox):
     def __init__(self, parent=None):
         super().__init__("Recent Activity", parent)
         self.setup_ui()
-        self.setup_styles()
     
     def setup_ui(self):
         """Setup the widget UI."""
         layout = QVBoxLayout(self)
         
-        self.activity_list = QListWidget()
+        # Rows are painted by a delegate, so no widgets are created per activity
+        self.activity_model = ActivityListModel(self)
+        self.activity_list = QListView()
+        self.activity_list.setModel(self.activity_model)
+        self.activity_list.setItemDelegate(ActivityDelegate(self.activity_list))
+        self.activity_list.setSelectionMode(QListView.SelectionMode.NoSelection)
+        self.activity_list.setUniformItemSizes(True)
+        self.activity_list.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.activity_list.setMouseTracking(True)  # hover highlight of the rows
         self.activity_list.setMaximumHeight(200)
         layout.addWidget(self.activity_list)
         
@@ -208,68 +428,9 @@ class RecentActivityWidget(QGroupBox):
         self.add_activity("✅", "SSL certificate renewed for 'example.com'", "1 hour ago")
         self.add_activity("��", "Monthly billing report generated", "3 hours ago")
     
-    def add_activity(self, icon: str, message: str, time: str):
+    def add_activity(self, icon: str, message: str, time_text: str):
         """Add an activity item."""
-        item = QListWidgetItem()
-        item_widget = QWidget()
-        item_layout = QHBoxLayout(item_widget)
-        item_layout.setContentsMargins(10, 5, 10, 5)
-        
-        # Icon
-        icon_label = QLabel(icon)
-        icon_label.setStyleSheet("font-size: 16px;")
-        item_layout.addWidget(icon_label)
-        
-        # Message
-        message_label = QLabel(message)
-        message_label.setStyleSheet("color: #212529; font-size: 14px;")
-        item_layout.addWidget(message_label)
-        
-        item_layout.addStretch()
-        
-        # Time
-        time_label = QLabel(time)
-        time_label.setStyleSheet("color: #6c757d; font-size: 12px;")
-        item_layout.addWidget(time_label)
-        
-        item.setSizeHint(item_widget.sizeHint())
-        self.activity_list.addItem(item)
-        self.activity_list.setItemWidget(item, item_widget)
-    
-    def setup_styles(self):
-        """Setup widget styles."""
-        self.setStyleSheet("""
-        QGroupBox {
-            font-size: 16px;
-            font-weight: bold;
-            color: #212529;
-            border: 1px solid #e9ecef;
-            border-radius: 8px;
-            margin-top: 10px;
-            padding-top: 10px;
-        }
-        
-        QGroupBox::title {
-            subcontrol-origin: margin;
-            left: 10px;
-            padding: 0 10px 0 10px;
-            background-color: white;
-        }
-        
-        QListWidget {
-            border: none;
-            background-color: transparent;
-        }
-        
-        QListWidget::item {
-            border-bottom: 1px solid #f8f9fa;
-            padding: 5px 0;
-        }
-        
-        QListWidget::item:hover {
-            background-color: #f8f9fa;
-        }
-        """)
+        self.activity_model.append_activity(icon, message, time_text)
 
 
 class DashboardPage(QWidget):
@@ -277,6 +438,16 @@ class DashboardPage(QWidget):
     
     # Signals
     quick_action_requested = Signal(str)  # action_id
+    stats_loaded = Signal(object, dict, bool)  # org_id (or None), statistics, complete (emitted from the I/O loop)
+    
+    # Auto-refresh interval (ms), only while the page is visible
+    REFRESH_INTERVAL = 30000
+    
+    # Seconds during which statistics are considered fresh when the page is shown again
+    SHOW_REFRESH_TTL = 5
+    
+    # Seconds the organization count is reused; the list rarely changes
+    ORGS_CACHE_TTL = 300
     
     def __init__(self, api_client: CleverCloudClient, parent=None):
         super().__init__(parent)
@@ -291,6 +462,11 @@ class DashboardPage(QWidget):
             'organizations': 0,
             'running_apps': 0
         }
+        self._last_refresh = 0.0  # time.monotonic() of the last successful refresh
+        
+        self._orgs_cache: Optional[Tuple[float, int]] = None  # (time.monotonic(), count), only touched from the I/O loop
+        
+        self.stats_loaded.connect(self._on_stats_loaded)
         
         self.setup_ui()
         self.setup_refresh_timer()
@@ -299,9 +475,11 @@ class DashboardPage(QWidget):
     
     def setup_ui(self):
         """Setup the dashboard UI."""
+        # Card and activity styles, parsed once for the whole page
+        self.setStyleSheet(DASHBOARD_STYLE)
+        
         # Main scroll area
         scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
         scroll.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
         scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         
@@ -316,27 +494,54 @@ class DashboardPage(QWidget):
         
         # Title and subtitle in same line
         title_label = QLabel("Dashboard")
-        title_label.setStyleSheet("""
-            font-size: 20px;
-            font-weight: bold;
-            color: #212529;
-        """)
+        title_label.setObjectName("pageTitle")
+        title_label.setFont(PAGE_TITLE_FONT)
         header_layout.addWidget(title_label)
         
         subtitle_label = QLabel("Monitor your Clever Cloud resources")
-        subtitle_label.setStyleSheet("""
-            font-size: 13px;
-            color: #6c757d;
-            margin-left: 15px;
-        """)
+        subtitle_label.setObjectName("pageSubtitle")
+        subtitle_label.setFont(PAGE_SUBTITLE_FONT)
         header_layout.addWidget(subtitle_label)
         header_layout.addStretch()
         
         content_layout.addLayout(header_layout)
         
-        # Statistics cards - horizontal layout for better space usage
-        stats_layout = QHBoxLayout()
-        stats_layout.setSpacing(10)  # Tighter spacing
+        # Cards and activity are built on first show
+        self._content_layout = content_layout
+        self.stats_cards: Dict[str, StatCard] = {}
+        self.activity_widget: Optional[RecentActivityWidget] = None
+        
+        # Track the viewport size only once the content widget is in place
+        scroll.setWidget(content_widget)
+        scroll.setWidgetResizable(True)
+        
+        # Main layout
+        main_layout = QVBoxLayout(self)
+        main_layout.setContentsMargins(0, 0, 0, 0)
+        main_layout.addWidget(scroll)
+    
+    def _build_content(self):
+        """Build the statistics cards, quick actions and recent activity."""
+        content_layout = self._content_layout
+        
+        # Paint the content once, after all of it has been added
+        content_widget = content_layout.parentWidget()
+        content_widget.setUpdatesEnabled(False)
+        try:
+            self._add_content(content_layout)
+        finally:
+            content_widget.setUpdatesEnabled(True)
+        
+        # Show statistics loaded before the cards existed
+        self.update_stats_display()
+    
+    def _add_content(self, content_layout: QVBoxLayout):
+        """Add the cards and activity columns to the content layout."""
+        # Statistics cards on the first row, quick actions and recent activity
+        # below, each column pair taking half of the width
+        grid_layout = QGridLayout()
+        grid_layout.setHorizontalSpacing(10)  # Tighter spacing
+        grid_layout.setVerticalSpacing(15)
         
         self.stats_cards = {
             'applications': StatCard("Applications", "0", "🚀", "#007ACC"),
@@ -345,26 +550,16 @@ class DashboardPage(QWidget):
             'organizations': StatCard("Organizations", "0", "🏢", "#6f42c1")
         }
         
-        # Add cards horizontally
-        for card in self.stats_cards.values():
-            stats_layout.addWidget(card)
-        
-        content_layout.addLayout(stats_layout)
-        
-        # Main content area with two columns
-        main_content_layout = QHBoxLayout()
-        main_content_layout.setSpacing(15)  # Reduced spacing
+        for column, card in enumerate(self.stats_cards.values()):
+            grid_layout.addWidget(card, 0, column)
+            grid_layout.setColumnStretch(column, 1)
         
         # Left column - Quick actions
         left_column = QVBoxLayout()
         
         actions_title = QLabel("Quick Actions")
-        actions_title.setStyleSheet("""
-            font-size: 16px;
-            font-weight: bold;
-            color: #212529;
-            margin-bottom: 8px;
-        """)
+        actions_title.setObjectName("sectionTitle")
+        actions_title.setFont(SECTION_TITLE_FONT)
         left_column.addWidget(actions_title)
         
         # Quick action cards - vertical layout in left column
@@ -377,108 +572,119 @@ class DashboardPage(QWidget):
         
         for action_id, title, description, icon in quick_actions:
             action_card = QuickActionCard(action_id, title, description, icon)
-            action_card.action_clicked.connect(self.quick_action_requested.emit)
+            action_card.action_clicked.connect(self.quick_action_requested)
             left_column.addWidget(action_card)
         
         left_column.addStretch()
+        grid_layout.addLayout(left_column, 1, 0, 1, 2)
         
         # Right column - Recent activity
-        right_column = QVBoxLayout()
-        
         self.activity_widget = RecentActivityWidget()
-        right_column.addWidget(self.activity_widget)
-        
-        # Add columns to main content
-        main_content_layout.addLayout(left_column, 1)  # 50% width
-        main_content_layout.addLayout(right_column, 1)  # 50% width
-        
-        content_layout.addLayout(main_content_layout)
-        
-        scroll.setWidget(content_widget)
+        grid_layout.addWidget(self.activity_widget, 1, 2, 1, 2)
         
-        # Main layout
-        main_layout = QVBoxLayout(self)
-        main_layout.setContentsMargins(0, 0, 0, 0)
-        main_layout.addWidget(scroll)
+        content_layout.addLayout(grid_layout)
     
     def setup_refresh_timer(self):
-        """Setup automatic refresh timer."""
-        self.refresh_timer = QTimer()
+        """Setup automatic refresh timer (only runs while the page is visible)."""
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setInterval(self.REFRESH_INTERVAL)
         self.refresh_timer.timeout.connect(self.refresh_stats)
-        self.refresh_timer.start(30000)  # Refresh every 30 seconds
-    
-    def refresh_stats(self):
-        """Refresh dashboard statistics using QTimer to handle async."""
-        # Use QTimer to schedule async data loading
-        QTimer.singleShot(100, self._refresh_stats_async)
-    
-    def _refresh_stats_async(self):
-        """Refresh dashboard statistics asynchronously."""
-        import asyncio
-        
-        async def refresh_data():
-            try:
-                self.logger.info(f"Refreshing dashboard statistics for org: {self.current_org_id}")
-                
-                # Get applications for current organization
-                if self.current_org_id:
-                    applications = await self.api_client.get_applications(self.current_org_id)
-                    addons = await self.api_client.get_addons(self.current_org_id)
-                else:
-                    # Fallback to all applications if no org selected
-                    applications = await self.api_client.get_applications()
-                    addons = await self.api_client.get_addons()
-                
-                self.stats_data['applications'] = len(applications)
-                
-                # Count running applications
-                running_count = sum(1 for app in applications if app.get('state') == 'RUNNING')
-                self.stats_data['running_apps'] = running_count
-                
-                # Get add-ons for current organization
-                self.stats_data['addons'] = len(addons)
-                
-                # Get organizations (always show total)
-                organizations = await self.api_client.get_organizations()
-                self.stats_data['organizations'] = len(organizations)
-                
-                # Update UI
-                self.update_stats_display()
-                
-                self.logger.info("Dashboard statistics updated")
-                
-            except Exception as e:
-                self.logger.error(f"Failed to refresh dashboard stats: {e}")
-        
-        # Create task for async operation
-        try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                # Schedule the coroutine
-                asyncio.create_task(refresh_data())
+    
+    def refresh_stats(self, force_refresh: bool = False):
+        """Refresh dashboard statistics on the background I/O loop, refetching organizations if force_refresh is set."""
+        org_id = self.current_org_id
+        self.logger.info(f"Refreshing dashboard statistics for org: {org_id}")
+        future = io_loop.submit(self._fetch_stats(org_id, force_refresh))
+        future.add_done_callback(partial(self._on_stats_future_done, org_id))
+    
+    async def _organization_count(self, api_client: CleverCloudClient, force_refresh: bool) -> int:
+        """Get the number of organizations, refetched once older than ORGS_CACHE_TTL (runs on the I/O loop)."""
+        if not force_refresh and self._orgs_cache is not None:
+            fetched_at, count = self._orgs_cache
+            if time.monotonic() - fetched_at < self.ORGS_CACHE_TTL:
+                return count
+        
+        count = len(await api_client.get_organizations(use_cache=not force_refresh))
+        self._orgs_cache = (time.monotonic(), count)
+        return count
+    
+    async def _fetch_stats(self, org_id: Optional[str], force_refresh: bool = False) -> Tuple[Dict[str, int], bool]:
+        """Fetch the statistics; return those that could be computed and whether all were (runs on the I/O loop)."""
+        api_client = await io_loop.get_client(self.api_client)
+        
+        # Fetch applications and add-ons for the organization (all of them if no org
+        # is selected) and the organizations, concurrently
+        applications, addons, organizations = await asyncio.gather(
+            api_client.get_applications(org_id),
+            api_client.get_addons(org_id),
+            self._organization_count(api_client, force_refresh),
+            return_exceptions=True
+        )
+        
+        # Leave out any statistic whose request failed, so it keeps its previous value
+        stats = {}
+        complete = True
+        for name, result in (('applications', applications), ('addons', addons),
+                             ('organizations', organizations)):
+            if isinstance(result, Exception):
+                self.logger.error("Failed to load %s for dashboard stats: %s", name, result)
+                complete = False
             else:
-                # Run in new loop
-                asyncio.run(refresh_data())
+                stats[name] = result if name == 'organizations' else len(result)
+        
+        # Count running applications
+        if 'applications' in stats:
+            stats['running_apps'] = [app.get('state') for app in applications].count('RUNNING')
+        
+        return stats, complete
+    
+    def _on_stats_future_done(self, org_id: Optional[str], future: Future):
+        """Forward finished statistics to the GUI thread."""
+        if future.cancelled():
+            return  # dropped at worker loop shutdown
+        try:
+            stats, complete = future.result()
         except Exception as e:
-            self.logger.error(f"Failed to schedule stats refresh: {e}")
+            self.logger.error(f"Failed to refresh dashboard stats: {e}")
+        else:
+            self.stats_loaded.emit(org_id, stats, complete)
+    
+    def _on_stats_loaded(self, org_id: Optional[str], stats: Dict[str, int], complete: bool):
+        """Show statistics fetched on the I/O loop."""
+        if org_id != self.current_org_id:
+            return  # the organization changed while loading
+        
+        self.stats_data.update(stats)
+        self.update_stats_display()
+        if complete:
+            self._last_refresh = time.monotonic()
+        
+        self.logger.info("Dashboard statistics updated")
     
     def update_stats_display(self):
         """Update the statistics display."""
-        self.stats_cards['applications'].update_value(str(self.stats_data['applications']))
-        self.stats_cards['running_apps'].update_value(str(self.stats_data['running_apps']))
-        self.stats_cards['addons'].update_value(str(self.stats_data['addons']))
-        self.stats_cards['organizations'].update_value(str(self.stats_data['organizations']))
+        # Cards skip unchanged values and Qt merges the repaints of the others
+        for key, card in self.stats_cards.items():
+            card.update_value(str(self.stats_data[key]))
     
     def set_organization(self, org_id: str):
         """Set the current organization and refresh data."""
         self.current_org_id = org_id
         self.logger.info(f"Dashboard page: Organization changed to {org_id}")
         # Refresh stats with new organization
-        self.refresh_stats()
+        self.refresh_stats(force_refresh=True)
     
     def showEvent(self, event):
         """Handle page show event."""
+        if self.activity_widget is None:
+            self._build_content()
         super().showEvent(event)
-        # Refresh stats when page is shown
-        if hasattr(self, 'api_client'):
-            self.refresh_stats() 
\ No newline at end of file
+        # Refresh stats when page is shown, unless they were just refreshed
+        if time.monotonic() - self._last_refresh > self.SHOW_REFRESH_TTL:
+            self.refresh_stats()
+        self.refresh_timer.start()
+    
+    def hideEvent(self, event):
+        """Handle page hide event - stop refreshing while not visible."""
+        self.refresh_timer.stop()
+        super().hideEvent(event) 
\ No newline at end of file
@@ -4,74 +4,113 @@ Login Dialog
 Modern login dialog for Clever Cloud authentication with OAuth2 support.
 """
 
-import asyncio
 import logging
-from typing import Optional
+from concurrent.futures import Future
+from typing import Awaitable, Callable, Optional, Set
 
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, 
     QProgressBar, QTextEdit, QCheckBox, QFrame, QWidget,
     QSpacerItem, QSizePolicy
 )
-from PySide6.QtCore import QTimer, Signal, QThread, QObject
+from PySide6.QtCore import QTimer, Signal
 from PySide6.QtGui import QPixmap, QFont
 from PySide6.QtCore import Qt
 
 from ..api.client import CleverCloudClient
+from ..api.io_loop import io_loop
 from ..api.auth import OAuth2Error
 
 
-class AuthWorker(QObject):
-    """Worker thread for OAuth2 authentication."""
+# Dialog stylesheet, applied on first show
+LOGIN_DIALOG_STYLE = """
+    QDialog {
+        background-color: #fafafa;
+    }
     
-    authentication_success = Signal(dict)  # user_info
-    authentication_failed = Signal(str)    # error_message
-    check_stored_auth_result = Signal(bool)  # success
+    QFrame {
+        background-color: white;
+        border: 1px solid #e0e0e0;
+        border-radius: 8px;
+        padding: 20px;
+    }
     
-    def __init__(self, client: CleverCloudClient):
-        super().__init__()
-        self.client = client
-        self.logger = logging.getLogger(__name__)
+    QPushButton {
+        background-color: #007ACC;
+        color: white;
+        border: none;
+        border-radius: 6px;
+        padding: 12px 24px;
+        font-weight: bold;
+        font-size: 14px;
+    }
     
-    def check_stored_authentication(self):
-        """Check if stored authentication is available and valid."""
-        try:
-            # Run async function in this thread's event loop
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
-            result = loop.run_until_complete(self.client.authenticate_with_stored_credentials())
-            self.check_stored_auth_result.emit(result)
-            
-            if result:
-                user_info = self.client.auth.user_info or {}
-                self.authentication_success.emit(user_info)
-            
-            loop.close()
-            
-        except Exception as e:
-            self.logger.error(f"Error checking stored authentication: {e}")
-            self.check_stored_auth_result.emit(False)
+    QPushButton:hover {
+        background-color: #005a9e;
+    }
     
-    def start_oauth_authentication(self):
-        """Start OAuth2 authentication flow."""
-        try:
-            # Run async function in this thread's event loop  
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
-            # Connect signals from auth manager
-            self.client.auth.authentication_success.connect(self.authentication_success.emit)
-            self.client.auth.authentication_failed.connect(self.authentication_failed.emit)
-            
-            # Start authentication
-            loop.run_until_complete(self.client.auth.authenticate())
-            
-            loop.close()
-            
-        except Exception as e:
-            self.logger.error(f"OAuth authentication error: {e}")
-            self.authentication_failed.emit(str(e))
+    QPushButton:pressed {
+        background-color: #004785;
+    }
+    
+    QPushButton:disabled {
+        background-color: #cccccc;
+        color: #666666;
+    }
+    
+    #help_button, #cancel_button {
+        background-color: transparent;
+        color: #666;
+        border: 1px solid #ccc;
+    }
+    
+    #help_button:hover, #cancel_button:hover {
+        background-color: #f5f5f5;
+    }
+    
+    QProgressBar {
+        border: 2px solid #e0e0e0;
+        border-radius: 5px;
+        text-align: center;
+        font-weight: bold;
+    }
+    
+    QProgressBar::chunk {
+        background-color: #007ACC;
+        border-radius: 3px;
+    }
+    
+    QTextEdit {
+        border: 1px solid #e0e0e0;
+        border-radius: 6px;
+        padding: 10px;
+        background-color: #f9f9f9;
+        font-size: 13px;
+    }
+    
+    QCheckBox {
+        font-size: 13px;
+        color: #333;
+    }
+    
+    QCheckBox::indicator {
+        width: 18px;
+        height: 18px;
+    }
+    
+    QCheckBox::indicator:unchecked {
+        border: 2px solid #ccc;
+        border-radius: 3px;
+        background-color: white;
+    }
+    
+    QCheckBox::indicator:checked {
+        border: 2px solid #007ACC;
+        border-radius: 3px;
+        background-color: #007ACC;
+        image: url(:/icons/check.png);
+    }
+"""
 
 
 class LoginDialog(QDialog):
@@ -79,6 +118,10 @@ class LoginDialog(QDialog):
     
     authentication_success = Signal(dict)  # user_info
     
+    # Results of the authentication coroutines, delivered to the GUI thread
+    stored_auth_checked = Signal(bool)     # success
+    authentication_failed = Signal(str)    # error_message
+    
     def __init__(self, client: CleverCloudClient, parent=None):
         super().__init__(parent)
         self.client = client
@@ -90,27 +133,22 @@ class LoginDialog(QDialog):
         self.setFixedSize(450, 600)
         self.setWindowFlag(Qt.WindowContextHelpButtonHint, False)
         
-        # Auth worker in separate thread
-        self.auth_worker = AuthWorker(self.client)
-        self.auth_thread = QThread()
-        self.auth_worker.moveToThread(self.auth_thread)
+        # Authentication runs on the shared I/O loop; attempts still pending
+        # when the dialog closes are cancelled
+        self._auth_futures: Set[Future] = set()
+        self._auth_signals_connected = False
         
-        # Connect worker signals
-        self.auth_worker.authentication_success.connect(self._on_authentication_success)
-        self.auth_worker.authentication_failed.connect(self._on_authentication_failed)
-        self.auth_worker.check_stored_auth_result.connect(self._on_stored_auth_checked)
+        self.stored_auth_checked.connect(self._on_stored_auth_checked)
+        self.authentication_failed.connect(self._on_authentication_failed)
         
         # Connect auth manager signals
         self.client.auth.token_input_required.connect(self._on_token_input_required)
         
-        # Connect thread signals
-        self.auth_thread.started.connect(self.auth_worker.check_stored_authentication)
-        
         self.setup_ui()
-        self.setup_styles()
         
-        # Auto-check for stored credentials
-        QTimer.singleShot(500, self._check_stored_credentials)
+        # Check for stored credentials right away: the keyring probe is cached by the
+        # auth manager and verification runs off the GUI thread
+        self._check_stored_credentials()
     
     def setup_ui(self):
         """Setup the dialog UI."""
@@ -200,12 +238,14 @@ class LoginDialog(QDialog):
         button_layout = QHBoxLayout()
         
         self.help_button = QPushButton("Help")
+        self.help_button.setObjectName("help_button")
         self.help_button.clicked.connect(self._show_help)
         button_layout.addWidget(self.help_button)
         
         button_layout.addItem(QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum))
         
         self.cancel_button = QPushButton("Cancel")
+        self.cancel_button.setObjectName("cancel_button")
         self.cancel_button.clicked.connect(self.reject)
         button_layout.addWidget(self.cancel_button)
         
@@ -216,113 +256,45 @@ class LoginDialog(QDialog):
     
     def setup_styles(self):
         """Setup custom styles for the dialog."""
-        self.setStyleSheet("""
-        QDialog {
-            background-color: #fafafa;
-        }
-        
-        QFrame {
-            background-color: white;
-            border: 1px solid #e0e0e0;
-            border-radius: 8px;
-            padding: 20px;
-        }
-        
-        QPushButton {
-            background-color: #007ACC;
-            color: white;
-            border: none;
-            border-radius: 6px;
-            padding: 12px 24px;
-            font-weight: bold;
-            font-size: 14px;
-        }
-        
-        QPushButton:hover {
-            background-color: #005a9e;
-        }
-        
-        QPushButton:pressed {
-            background-color: #004785;
-        }
-        
-        QPushButton:disabled {
-            background-color: #cccccc;
-            color: #666666;
-        }
-        
-        #help_button, #cancel_button {
-            background-color: transparent;
-            color: #666;
-            border: 1px solid #ccc;
-        }
-        
-        #help_button:hover, #cancel_button:hover {
-            background-color: #f5f5f5;
-        }
-        
-        QProgressBar {
-            border: 2px solid #e0e0e0;
-            border-radius: 5px;
-            text-align: center;
-            font-weight: bold;
-        }
-        
-        QProgressBar::chunk {
-            background-color: #007ACC;
-            border-radius: 3px;
-        }
-        
-        QTextEdit {
-            border: 1px solid #e0e0e0;
-            border-radius: 6px;
-            padding: 10px;
-            background-color: #f9f9f9;
-            font-size: 13px;
-        }
-        
-        QCheckBox {
-            font-size: 13px;
-            color: #333;
-        }
-        
-        QCheckBox::indicator {
-            width: 18px;
-            height: 18px;
-        }
-        
-        QCheckBox::indicator:unchecked {
-            border: 2px solid #ccc;
-            border-radius: 3px;
-            background-color: white;
-        }
-        
-        QCheckBox::indicator:checked {
-            border: 2px solid #007ACC;
-            border-radius: 3px;
-            background-color: #007ACC;
-            image: url(:/icons/check.png);
-        }
-        """)
-        
-        # Set object names for styling
-        self.help_button.setObjectName("help_button")
-        self.cancel_button.setObjectName("cancel_button")
+        self.setStyleSheet(LOGIN_DIALOG_STYLE)
+    
+    def showEvent(self, event):
+        """Apply the stylesheet the first time the dialog is shown."""
+        if not self.styleSheet():
+            self.setup_styles()
+        super().showEvent(event)
+    
+    def _run_async(self, coro: Awaitable, done_callback: Callable[[Future], None]):
+        """Run a coroutine on the I/O loop, keeping its future until it completes."""
+        future = io_loop.submit(coro)
+        self._auth_futures.add(future)
+        future.add_done_callback(self._auth_futures.discard)
+        future.add_done_callback(done_callback)
     
     def _check_stored_credentials(self):
         """Check for stored credentials."""
         if self.client.has_stored_credentials():
             self.status_label.setText("Found saved credentials, verifying...")
-            self.auth_thread.start()
+            self._run_async(self.client.authenticate_with_stored_credentials(), self._on_stored_auth_future_done)
         else:
             self._show_login_options()
     
+    def _on_stored_auth_future_done(self, future: Future):
+        """Forward the stored authentication check to the GUI thread."""
+        if future.cancelled():
+            return
+        try:
+            success = future.result()
+        except Exception as e:
+            self.logger.error(f"Error checking stored authentication: {e}")
+            success = False
+        self.stored_auth_checked.emit(success)
+    
     def _on_stored_auth_checked(self, success: bool):
         """Handle result of stored authentication check."""
-        self.auth_thread.quit()
-        self.auth_thread.wait()
-        
-        if not success:
+        if success:
+            self._on_authentication_success(self.client.auth.user_info or {})
+        else:
             self._show_login_options()
     
     def _show_login_options(self):
@@ -340,22 +312,26 @@ class LoginDialog(QDialog):
         self.status_frame.show()
         self.login_frame.hide()
         
-        # Start OAuth in worker thread
-        self.auth_thread = QThread()
-        self.auth_worker = AuthWorker(self.client)
-        self.auth_worker.moveToThread(self.auth_thread)
+        # The auth manager reports the outcome through its signals
+        if not self._auth_signals_connected:
+            self.client.auth.authentication_success.connect(self._on_authentication_success)
+            self.client.auth.authentication_failed.connect(self._on_authentication_failed)
+            self._auth_signals_connected = True
         
-        self.auth_worker.authentication_success.connect(self._on_authentication_success)
-        self.auth_worker.authentication_failed.connect(self._on_authentication_failed)
-        self.auth_thread.started.connect(self.auth_worker.start_oauth_authentication)
-        
-        self.auth_thread.start()
+        self._run_async(self.client.auth.authenticate(), self._on_oauth_future_done)
+    
+    def _on_oauth_future_done(self, future: Future):
+        """Report an authentication flow that raised to the GUI thread."""
+        if future.cancelled():
+            return
+        try:
+            future.result()
+        except Exception as e:
+            self.logger.error(f"OAuth authentication error: {e}")
+            self.authentication_failed.emit(str(e))
     
     def _on_authentication_success(self, user_info: dict):
         """Handle successful authentication."""
-        self.auth_thread.quit()
-        self.auth_thread.wait()
-        
         self.progress_bar.setRange(0, 1)
         self.progress_bar.setValue(1)
         
@@ -372,9 +348,6 @@ class LoginDialog(QDialog):
     
     def _on_authentication_failed(self, error_message: str):
         """Handle authentication failure."""
-        self.auth_thread.quit()
-        self.auth_thread.wait()
-        
         self.progress_bar.setRange(0, 1)
         self.progress_bar.setValue(0)
         
@@ -445,9 +418,17 @@ class LoginDialog(QDialog):
             """
         )
     
+    def done(self, result: int):
+        """Cancel pending authentication once the dialog is accepted or rejected."""
+        self._cancel_pending_auth()
+        super().done(result)
+    
     def closeEvent(self, event):
         """Handle dialog close event."""
-        if self.auth_thread.isRunning():
-            self.auth_thread.quit()
-            self.auth_thread.wait()
-        event.accept() 
\ No newline at end of file
+        self._cancel_pending_auth()
+        event.accept()
+    
+    def _cancel_pending_auth(self):
+        """Cancel authentication still running on the I/O loop."""
+        for future in list(self._auth_futures):
+            future.cancel()